@@ -6,44 +6,134 @@
 #![allow(clippy::unwrap_used, clippy::expect_used)]
 
 use serde::Serialize;
-use serde_json::Value;
-use std::collections::BTreeMap;
+use serde_json::{Map, Value};
+use sha2::{Digest, Sha256};
+use std::io::{self, Write};
+use std::sync::OnceLock;
 
 /// Convert any serializable value to canonical JSON
-/// Recursively uses BTreeMap for maps; produces compact JSON identical to TypeScript SDK
+/// Recursively sorts object keys; produces compact JSON identical to TypeScript SDK
 pub fn dumps_canonical<T: Serialize>(value: &T) -> String {
     let json_value = serde_json::to_value(value).expect("Serialization should not fail");
     canonicalize(&json_value)
 }
 
 /// Convert a JSON value to canonical JSON string with deterministic ordering
+///
+/// The value is walked once and emitted straight into a single output buffer,
+/// so no intermediate string is built per nested object or array.
 pub fn canonicalize(value: &Value) -> String {
-    canonicalize_internal(value)
+    let mut out = Vec::with_capacity(128);
+    canonicalize_into(value, &mut out);
+    String::from_utf8(out).expect("Canonical JSON is valid UTF-8")
 }
 
-fn canonicalize_internal(value: &Value) -> String {
+/// Canonical JSON encoding of a value as UTF-8 bytes
+///
+/// Same output as [`canonicalize`], for callers that hash or sign the bytes
+/// and have no use for a `String`.
+pub fn canonicalize_bytes(value: &Value) -> Vec<u8> {
+    let mut out = Vec::with_capacity(128);
+    canonicalize_into(value, &mut out);
+    out
+}
+
+/// Append the canonical JSON encoding of a value to an existing byte buffer
+///
+/// Lets batch callers reuse one allocation across many values; clear the
+/// buffer between values if only the latest encoding is wanted.
+pub fn canonicalize_into(value: &Value, out: &mut Vec<u8>) {
+    canonicalize_to_writer(value, out).expect("Writing to a Vec cannot fail");
+}
+
+/// Stream the canonical JSON encoding of a value into any writer
+pub fn canonicalize_to_writer<W: Write>(value: &Value, writer: &mut W) -> io::Result<()> {
+    if map_is_sorted() {
+        // Objects already iterate in canonical order, so serde_json's compact
+        // serializer emits exactly the canonical form
+        serde_json::to_writer(writer, value).map_err(io::Error::from)
+    } else {
+        write_canonical(value, writer)
+    }
+}
+
+/// SHA-256 of the canonical JSON encoding of a value
+///
+/// The encoding is streamed into the hasher as it is produced, so the full
+/// canonical JSON is never held in memory.
+pub fn canonical_sha256(value: &Value) -> [u8; 32] {
+    let mut hasher = Sha256::new();
+    canonicalize_to_writer(value, &mut hasher).expect("SHA-256 hasher accepts all input");
+    hasher.finalize().into()
+}
+
+/// SHA-256 of bytes the caller guarantees are already canonical JSON
+///
+/// Skips parsing and re-encoding entirely. The contract is that `bytes` equals
+/// `canonicalize_bytes` of its own parse, e.g. output kept from an earlier
+/// canonicalization. Debug builds check this when `ACC_VERIFY_CANONICAL=1`.
+pub fn hash_canonical_bytes(bytes: &[u8]) -> [u8; 32] {
+    if cfg!(debug_assertions) && std::env::var_os("ACC_VERIFY_CANONICAL").is_some_and(|v| v == "1")
+    {
+        debug_assert!(
+            is_canonical(bytes),
+            "hash_canonical_bytes called with non-canonical JSON"
+        );
+    }
+    Sha256::digest(bytes).into()
+}
+
+/// Whether `bytes` parses as JSON and is already in canonical form
+pub fn is_canonical(bytes: &[u8]) -> bool {
+    serde_json::from_slice::<Value>(bytes).is_ok_and(|value| canonicalize_bytes(&value) == bytes)
+}
+
+/// Whether `serde_json::Map` iterates its keys in sorted order in this build
+///
+/// True unless some crate in the dependency graph turns on serde_json's
+/// `preserve_order` feature, in which case objects are sorted by hand.
+fn map_is_sorted() -> bool {
+    static SORTED: OnceLock<bool> = OnceLock::new();
+    *SORTED.get_or_init(|| {
+        let mut probe = Map::new();
+        probe.insert("b".to_string(), Value::Null);
+        probe.insert("a".to_string(), Value::Null);
+        probe.keys().next().map(String::as_str) == Some("a")
+    })
+}
+
+fn write_canonical<W: Write>(value: &Value, out: &mut W) -> io::Result<()> {
     match value {
-        Value::Null => "null".to_string(),
-        Value::Bool(b) => b.to_string(),
-        Value::Number(n) => n.to_string(),
-        Value::String(s) => serde_json::to_string(s).unwrap(),
+        Value::Null => out.write_all(b"null"),
+        Value::Bool(true) => out.write_all(b"true"),
+        Value::Bool(false) => out.write_all(b"false"),
+        Value::Number(n) => write!(out, "{n}"),
+        Value::String(s) => serde_json::to_writer(&mut *out, s).map_err(io::Error::from),
         Value::Array(arr) => {
-            let elements: Vec<String> = arr.iter().map(canonicalize_internal).collect();
-            format!("[{}]", elements.join(","))
+            out.write_all(b"[")?;
+            for (i, element) in arr.iter().enumerate() {
+                if i > 0 {
+                    out.write_all(b",")?;
+                }
+                write_canonical(element, out)?;
+            }
+            out.write_all(b"]")
         }
         Value::Object(obj) => {
-            // Convert to BTreeMap to ensure sorted keys (canonical ordering)
-            let mut sorted: BTreeMap<String, String> = BTreeMap::new();
-            for (key, val) in obj {
-                sorted.insert(key.clone(), canonicalize_internal(val));
-            }
+            // Sort borrowed entries by key to get canonical ordering
+            let mut sorted: Vec<(&String, &Value)> = obj.iter().collect();
+            sorted.sort_unstable_by(|a, b| a.0.cmp(b.0));
 
-            let pairs: Vec<String> = sorted
-                .iter()
-                .map(|(k, v)| format!("{}:{}", serde_json::to_string(k).unwrap(), v))
-                .collect();
-
-            format!("{{{}}}", pairs.join(","))
+            out.write_all(b"{")?;
+            for (i, (key, val)) in sorted.into_iter().enumerate() {
+                if i > 0 {
+                    out.write_all(b",")?;
+                }
+                serde_json::to_writer(&mut *out, key).map_err(io::Error::from)?;
+                out.write_all(b":")?;
+                write_canonical(val, out)?;
+            }
+            out.write_all(b"}")
         }
     }
 }
@@ -95,6 +185,47 @@ mod tests {
         assert_eq!(canonical, r#"{"a":1,"m":2,"z":3}"#);
     }
 
+    #[test]
+    fn test_manual_encoder_matches_serializer() {
+        let value = json!({
+            "z": [{ "b": "q\"\\\n", "a": 1.5 }, null, true],
+            "a": { "y": -7, "x": "emoji🌍" },
+            "β": 18446744073709551615u64
+        });
+
+        let mut manual = Vec::new();
+        write_canonical(&value, &mut manual).unwrap();
+        assert_eq!(String::from_utf8(manual).unwrap(), canonicalize(&value));
+    }
+
+    #[test]
+    fn test_canonical_sha256_matches_buffered_hash() {
+        let value = json!({
+            "header": { "principal": "acc://alice.acme/tokens", "timestamp": 1234567890123u64 },
+            "body": { "type": "send-tokens", "to": [{ "url": "acc://bob.acme/tokens", "amount": "1000" }] }
+        });
+
+        assert_eq!(
+            hex::encode(canonical_sha256(&value)),
+            "4be49c59c717f1984646998cecac0e5225378d9bbe2e18928272a85b7dfcb608"
+        );
+        assert_eq!(
+            canonical_sha256(&value),
+            crate::codec::sha256_bytes(&canonicalize_bytes(&value))
+        );
+    }
+
+    #[test]
+    fn test_hash_canonical_bytes() {
+        let value = json!({ "z": 1, "a": [true, null] });
+        let canonical = canonicalize_bytes(&value);
+
+        assert!(is_canonical(&canonical));
+        assert!(!is_canonical(br#"{"z":1,"a":[true,null]}"#));
+        assert!(!is_canonical(b"not json"));
+        assert_eq!(hash_canonical_bytes(&canonical), canonical_sha256(&value));
+    }
+
     #[test]
     fn test_primitives() {
         assert_eq!(canonicalize(&json!(null)), "null");
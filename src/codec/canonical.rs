@@ -7,7 +7,6 @@
 #![allow(clippy::unwrap_used)]
 
 use serde_json::{Map, Value};
-use std::collections::BTreeMap;
 
 /// Canonical JSON encoder for Accumulate protocol
 #[derive(Debug, Clone, Copy)]
@@ -15,52 +14,26 @@ pub struct CanonicalEncoder;
 
 impl CanonicalEncoder {
     /// Encode a JSON value to canonical string format
+    ///
+    /// Delegates to the streaming encoder in [`crate::canonjson`], which writes
+    /// into one buffer instead of building a string per nested value.
     pub fn encode(value: &Value) -> String {
-        Self::encode_value(value)
-    }
-
-    fn encode_value(value: &Value) -> String {
-        match value {
-            Value::Null => "null".to_string(),
-            Value::Bool(b) => b.to_string(),
-            Value::Number(n) => n.to_string(),
-            Value::String(s) => serde_json::to_string(s).unwrap(),
-            Value::Array(arr) => Self::encode_array(arr),
-            Value::Object(obj) => Self::encode_object(obj),
-        }
-    }
-
-    fn encode_array(arr: &[Value]) -> String {
-        let elements: Vec<String> = arr.iter().map(Self::encode_value).collect();
-        format!("[{}]", elements.join(","))
-    }
-
-    fn encode_object(obj: &Map<String, Value>) -> String {
-        // Sort keys alphabetically for deterministic output
-        let mut sorted_keys: Vec<&String> = obj.keys().collect();
-        sorted_keys.sort();
-
-        let pairs: Vec<String> = sorted_keys
-            .iter()
-            .map(|key| {
-                let key_json = serde_json::to_string(key).unwrap();
-                let value_json = Self::encode_value(obj.get(*key).unwrap());
-                format!("{}:{}", key_json, value_json)
-            })
-            .collect();
-
-        format!("{{{}}}", pairs.join(","))
+        crate::canonjson::canonicalize(value)
     }
 
     /// Pre-process a JSON value to ensure all objects have sorted keys
     pub fn canonicalize(value: &Value) -> Value {
         match value {
             Value::Object(map) => {
-                let mut btree: BTreeMap<String, Value> = BTreeMap::new();
-                for (k, v) in map {
-                    btree.insert(k.clone(), Self::canonicalize(v));
-                }
-                Value::Object(Map::from_iter(btree.into_iter()))
+                // Sort borrowed entries, then build the output map in that order
+                let mut sorted: Vec<(&String, &Value)> = map.iter().collect();
+                sorted.sort_unstable_by(|a, b| a.0.cmp(b.0));
+                Value::Object(
+                    sorted
+                        .into_iter()
+                        .map(|(k, v)| (k.clone(), Self::canonicalize(v)))
+                        .collect::<Map<String, Value>>(),
+                )
             }
             Value::Array(arr) => Value::Array(arr.iter().map(Self::canonicalize).collect()),
             _ => value.clone(),
@@ -3,7 +3,7 @@
 //! This module provides convenient wrapper functions around the core hashing implementation
 //! to match the API expected by test files and provide TypeScript SDK compatibility.
 
-use crate::codec::{canonical_json, sha256_bytes};
+use crate::codec::sha256_bytes;
 use serde_json::Value;
 
 /// High-level hash helper providing convenient hashing operations
@@ -23,14 +23,12 @@ impl HashHelper {
 
     /// Compute SHA-256 hash of JSON data
     pub fn sha256_json(json_data: &Value) -> [u8; 32] {
-        let canonical = canonical_json(json_data);
-        sha256_bytes(canonical.as_bytes())
+        crate::canonjson::canonical_sha256(json_data)
     }
 
     /// Compute SHA-256 hash of JSON data and return as hex string
     pub fn sha256_json_hex(json_data: &Value) -> String {
-        let canonical = canonical_json(json_data);
-        hex::encode(sha256_bytes(canonical.as_bytes()))
+        hex::encode(Self::sha256_json(json_data))
     }
 
     /// Convert bytes to hex string
@@ -76,8 +74,40 @@ impl HashHelper {
 
     /// Verify hash matches expected hex value
     pub fn verify_hash_hex(data: &[u8], expected_hex: &str) -> bool {
-        let computed_hash = hex::encode(sha256_bytes(data));
-        computed_hash == expected_hex
+        match Self::decode_digest(expected_hex) {
+            Ok(expected) => Self::verify_hash(data, &expected),
+            Err(_) => false,
+        }
+    }
+
+    /// Verify the canonical JSON hash of a value against a decoded digest
+    pub fn verify_json_hash(json_data: &Value, expected_hash: &[u8; 32]) -> bool {
+        &Self::sha256_json(json_data) == expected_hash
+    }
+
+    /// Verify the canonical JSON hash of a value against a hex digest
+    pub fn verify_json_hash_hex(json_data: &Value, expected_hex: &str) -> bool {
+        match Self::decode_digest(expected_hex) {
+            Ok(expected) => Self::verify_json_hash(json_data, &expected),
+            Err(_) => false,
+        }
+    }
+
+    /// Decode a hex SHA-256 digest into a fixed-size array
+    pub fn decode_digest(hex_str: &str) -> Result<[u8; 32], hex::FromHexError> {
+        let mut digest = [0u8; 32];
+        hex::decode_to_slice(hex_str, &mut digest)?;
+        Ok(digest)
+    }
+
+    /// Decode a list of hex digests once, for repeated checks with the byte-based verifiers
+    pub fn decode_digests<S: AsRef<str>>(
+        hex_digests: &[S],
+    ) -> Result<Vec<[u8; 32]>, hex::FromHexError> {
+        hex_digests
+            .iter()
+            .map(|hex_str| Self::decode_digest(hex_str.as_ref()))
+            .collect()
     }
 }
 
@@ -158,5 +188,22 @@ mod tests {
         // Test with wrong data
         assert!(!HashHelper::verify_hash(b"wrong data", &hash));
         assert!(!HashHelper::verify_hash_hex(b"wrong data", &hash_hex));
+
+        // Malformed or wrong-length hex never verifies
+        assert!(!HashHelper::verify_hash_hex(data, "not hex"));
+        assert!(!HashHelper::verify_hash_hex(data, &hash_hex[..62]));
+    }
+
+    #[test]
+    fn test_json_hash_verification() {
+        let json_data = json!({"b": 2, "a": 1});
+        let hash_hex = HashHelper::sha256_json_hex(&json_data);
+
+        let digests = HashHelper::decode_digests(&[hash_hex.as_str()]).unwrap();
+        assert!(HashHelper::verify_json_hash(&json_data, &digests[0]));
+        assert!(HashHelper::verify_json_hash_hex(&json_data, &hash_hex));
+        assert!(!HashHelper::verify_json_hash(&json!({"a": 2}), &digests[0]));
+
+        assert!(HashHelper::decode_digests(&["zz"]).is_err());
     }
-}
\ No newline at end of file
+}
@@ -3,10 +3,13 @@
 //! This module provides SHA-256 hashing utilities with byte-for-byte compatibility
 //! with the TypeScript SDK for deterministic transaction and data hashing.
 
-use super::{canonical_json, BinaryWriter, EncodingError};
+use super::{BinaryWriter, EncodingError};
 use serde_json::Value;
 use sha2::{Digest, Sha256};
 
+/// Smallest batch [`AccumulateHash::hash_transactions_parallel`] splits across threads
+const PARALLEL_HASH_MIN_BATCH: usize = 64;
+
 /// Hash types used in Accumulate protocol
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum HashType {
@@ -26,9 +29,7 @@ impl AccumulateHash {
     /// SHA-256 hash of raw bytes
     /// Matches TS: hash(data: Uint8Array): Uint8Array
     pub fn sha256_bytes(data: &[u8]) -> [u8; 32] {
-        let mut hasher = Sha256::new();
-        hasher.update(data);
-        hasher.finalize().into()
+        super::sha256_bytes(data)
     }
 
     /// SHA-256 hash of raw bytes, returning hex string
@@ -41,8 +42,13 @@ impl AccumulateHash {
     /// SHA-256 hash of canonical JSON
     /// Matches TS: hashJson(obj: any): Uint8Array
     pub fn sha256_json(value: &Value) -> [u8; 32] {
-        let canonical = canonical_json(value);
-        Self::sha256_bytes(canonical.as_bytes())
+        crate::canonjson::canonical_sha256(value)
+    }
+
+    /// SHA-256 hash of the canonical JSON of each value, in order
+    /// Each value is streamed into its hasher, so no encode buffer is allocated
+    pub fn sha256_json_many(values: &[Value]) -> Vec<[u8; 32]> {
+        values.iter().map(Self::sha256_json).collect()
     }
 
     /// SHA-256 hash of canonical JSON, returning hex string
@@ -130,6 +136,45 @@ impl AccumulateHash {
         Self::sha256_json(transaction)
     }
 
+    /// Hash a batch of transactions using canonical JSON, in order
+    /// Intended for replay and indexing workloads; see [`Self::sha256_json_many`]
+    pub fn hash_transaction_many(transactions: &[Value]) -> Vec<[u8; 32]> {
+        Self::sha256_json_many(transactions)
+    }
+
+    /// Hash a batch of transactions across threads, in order
+    /// Same result as [`Self::hash_transaction_many`]; the batch is split into one
+    /// contiguous chunk per worker. `workers` defaults to the available parallelism,
+    /// and batches too small to pay for thread start-up are hashed serially.
+    pub fn hash_transactions_parallel(
+        transactions: &[Value],
+        workers: Option<usize>,
+    ) -> Vec<[u8; 32]> {
+        let workers = workers
+            .or_else(|| std::thread::available_parallelism().ok().map(usize::from))
+            .unwrap_or(1)
+            .max(1);
+        if workers == 1 || transactions.len() < PARALLEL_HASH_MIN_BATCH {
+            return Self::hash_transaction_many(transactions);
+        }
+
+        let chunk_len = (transactions.len() + workers - 1) / workers;
+        let mut hashes = vec![[0u8; 32]; transactions.len()];
+        std::thread::scope(|scope| {
+            for (chunk, out) in transactions
+                .chunks(chunk_len)
+                .zip(hashes.chunks_mut(chunk_len))
+            {
+                scope.spawn(move || {
+                    for (transaction, hash) in chunk.iter().zip(out) {
+                        *hash = Self::hash_transaction(transaction);
+                    }
+                });
+            }
+        });
+        hashes
+    }
+
     /// Hash a transaction using canonical JSON, returning hex string
     pub fn hash_transaction_hex(transaction: &Value) -> String {
         let hash = Self::hash_transaction(transaction);
@@ -476,6 +521,48 @@ mod tests {
         assert_eq!(hash1, hash3);
     }
 
+    #[test]
+    fn test_json_hashing_many() {
+        let values = vec![
+            json!({"b": 2, "a": 1}),
+            json!({"header": {"principal": "acc://alice.acme/tokens"}, "body": {"type": "send-tokens"}}),
+            json!([]),
+        ];
+
+        let hashes = AccumulateHash::sha256_json_many(&values);
+        assert_eq!(hashes.len(), values.len());
+        for (value, hash) in values.iter().zip(&hashes) {
+            assert_eq!(*hash, AccumulateHash::sha256_json(value));
+        }
+        assert!(AccumulateHash::sha256_json_many(&[]).is_empty());
+        assert_eq!(AccumulateHash::hash_transaction_many(&values), hashes);
+    }
+
+    #[test]
+    fn test_parallel_transaction_hashing() {
+        let transactions: Vec<Value> = (0..150)
+            .map(|i| json!({"header": {"principal": format!("acc://user{}.acme", i)}, "body": {"type": "writeData"}}))
+            .collect();
+        let serial = AccumulateHash::hash_transaction_many(&transactions);
+
+        assert_eq!(
+            AccumulateHash::hash_transactions_parallel(&transactions, Some(4)),
+            serial
+        );
+        assert_eq!(
+            AccumulateHash::hash_transactions_parallel(&transactions, None),
+            serial
+        );
+        assert_eq!(
+            AccumulateHash::hash_transactions_parallel(&transactions, Some(0)),
+            serial
+        );
+        assert_eq!(
+            AccumulateHash::hash_transactions_parallel(&transactions[..3], Some(4)),
+            serial[..3]
+        );
+    }
+
     #[test]
     fn test_url_normalization() {
         let test_cases = vec![
@@ -5,9 +5,8 @@
 
 #![allow(missing_docs)]
 
-use serde_json::{Map, Value};
+use serde_json::Value;
 use sha2::{Digest, Sha256};
-use std::collections::BTreeMap;
 
 pub mod canonical;
 pub mod crypto;
@@ -34,6 +33,11 @@ pub fn canonical_json(value: &Value) -> String {
     crate::canonjson::canonicalize(value)
 }
 
+/// Canonical JSON of a value as UTF-8 bytes, ready for hashing or signing
+pub fn canonical_json_bytes(value: &Value) -> Vec<u8> {
+    crate::canonjson::canonicalize_bytes(value)
+}
+
 /// Convert any serializable value to canonical JSON
 /// Convenience wrapper around canonjson::dumps_canonical
 pub fn to_canonical_string<T: serde::Serialize>(value: &T) -> String {
@@ -41,32 +45,22 @@ pub fn to_canonical_string<T: serde::Serialize>(value: &T) -> String {
 }
 
 /// SHA-256 hash of raw bytes
+///
+/// One-shot digest; `sha2` detects SHA-NI / ARMv8 SHA extensions at runtime
+/// and uses them when the CPU supports them.
 pub fn sha256_bytes(data: &[u8]) -> [u8; 32] {
-    let mut hasher = Sha256::new();
-    hasher.update(data);
-    hasher.finalize().into()
+    Sha256::digest(data).into()
 }
 
 /// SHA-256 hash of a JSON value via canonical JSON
 pub fn sha256_hex(value: &Value) -> String {
-    let canonical = canonical_json(value);
-    let hash = sha256_bytes(canonical.as_bytes());
+    let hash = crate::canonjson::canonical_sha256(value);
     hex::encode(hash)
 }
 
 /// Deterministic JSON object conversion ensuring sorted keys
 pub fn canonicalize_value(value: &Value) -> Value {
-    match value {
-        Value::Object(map) => {
-            let mut btree: BTreeMap<String, Value> = BTreeMap::new();
-            for (k, v) in map {
-                btree.insert(k.clone(), canonicalize_value(v));
-            }
-            Value::Object(Map::from_iter(btree.into_iter()))
-        }
-        Value::Array(arr) => Value::Array(arr.iter().map(canonicalize_value).collect()),
-        _ => value.clone(),
-    }
+    CanonicalEncoder::canonicalize(value)
 }
 
 #[cfg(test)]
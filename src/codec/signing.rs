@@ -445,7 +445,11 @@ pub fn marshal_create_data_account_body(url: &str, authorities: &[String]) -> Ve
 /// - Field 2: Entry (nested DataEntry)
 /// - Field 3: Scratch (bool, optional)
 /// - Field 4: WriteToState (bool, optional)
-pub fn marshal_write_data_body(entries_hex: &[String], scratch: bool, write_to_state: bool) -> Vec<u8> {
+pub fn marshal_write_data_body<S: AsRef<str>>(
+    entries_hex: &[S],
+    scratch: bool,
+    write_to_state: bool,
+) -> Vec<u8> {
     let mut writer = BinaryWriter::new();
 
     // Field 1: Type (WriteData = 0x05)
@@ -480,7 +484,7 @@ pub fn marshal_write_data_body(entries_hex: &[String], scratch: bool, write_to_s
 /// Field order:
 /// - Field 1: Type (enum = 3 for DoubleHash)
 /// - Field 2: Data (repeated bytes)
-fn marshal_data_entry(entries_hex: &[String]) -> Vec<u8> {
+fn marshal_data_entry<S: AsRef<str>>(entries_hex: &[S]) -> Vec<u8> {
     let mut writer = BinaryWriter::new();
 
     // Field 1: Type (DoubleHash = 3)
@@ -489,7 +493,7 @@ fn marshal_data_entry(entries_hex: &[String]) -> Vec<u8> {
 
     // Field 2: Data (repeated bytes)
     for entry_hex in entries_hex {
-        if let Ok(data) = hex::decode(entry_hex) {
+        if let Ok(data) = hex::decode(entry_hex.as_ref()) {
             let _ = writer.write_uvarint(2);
             let _ = writer.write_uvarint(data.len() as u64);
             let _ = writer.write_bytes(&data);
@@ -651,11 +655,7 @@ pub fn compute_transaction_hash(header_bytes: &[u8], body_bytes: &[u8]) -> [u8;
     let header_hash = sha256_bytes(header_bytes);
     let body_hash = sha256_bytes(body_bytes);
 
-    let mut combined = Vec::with_capacity(64);
-    combined.extend_from_slice(&header_hash);
-    combined.extend_from_slice(&body_hash);
-
-    sha256_bytes(&combined)
+    sha256_pair(&header_hash, &body_hash)
 }
 
 /// Create signing preimage
@@ -666,21 +666,23 @@ pub fn create_signing_preimage(
     signature_metadata_hash: &[u8; 32],
     transaction_hash: &[u8; 32],
 ) -> [u8; 32] {
-    let mut combined = Vec::with_capacity(64);
-    combined.extend_from_slice(signature_metadata_hash);
-    combined.extend_from_slice(transaction_hash);
-
-    sha256_bytes(&combined)
+    sha256_pair(signature_metadata_hash, transaction_hash)
 }
 
 /// SHA256 hash helper
 pub fn sha256_bytes(data: &[u8]) -> [u8; 32] {
+    super::sha256_bytes(data)
+}
+
+/// SHA256 of two hashes back to back: SHA256(left + right)
+///
+/// Both halves are fed to the hasher in turn rather than copied into a
+/// 64-byte concatenation buffer first.
+pub fn sha256_pair(left: &[u8; 32], right: &[u8; 32]) -> [u8; 32] {
     let mut hasher = Sha256::new();
-    hasher.update(data);
-    let result = hasher.finalize();
-    let mut output = [0u8; 32];
-    output.copy_from_slice(&result);
-    output
+    hasher.update(left);
+    hasher.update(right);
+    hasher.finalize().into()
 }
 
 // =============================================================================
@@ -692,7 +694,11 @@ pub fn sha256_bytes(data: &[u8]) -> [u8; 32] {
 /// Based on Go: protocol/transaction_hash.go:91-114
 /// 1. Marshal WriteData body with Entry=nil (only Type, Scratch, WriteToState)
 /// 2. Compute Merkle hash of [SHA256(marshaledBody), entryHash]
-pub fn compute_write_data_body_hash(entries_hex: &[String], scratch: bool, write_to_state: bool) -> [u8; 32] {
+pub fn compute_write_data_body_hash<S: AsRef<str>>(
+    entries_hex: &[S],
+    scratch: bool,
+    write_to_state: bool,
+) -> [u8; 32] {
     // Marshal body WITHOUT entry
     let body_without_entry = marshal_write_data_body_without_entry(scratch, write_to_state);
     let body_part_hash = sha256_bytes(&body_without_entry);
@@ -737,7 +743,10 @@ fn marshal_write_data_body_without_entry(scratch: bool, write_to_state: bool) ->
 ///
 /// Same algorithm as WriteData but with Type=WRITE_DATA_TO and Recipient included
 /// Based on Go: protocol/transaction_hash.go WriteDataTo.GetHash()
-pub fn compute_write_data_to_body_hash(recipient: &str, entries_hex: &[String]) -> [u8; 32] {
+pub fn compute_write_data_to_body_hash<S: AsRef<str>>(
+    recipient: &str,
+    entries_hex: &[S],
+) -> [u8; 32] {
     // Marshal body WITHOUT entry (but WITH recipient)
     let body_without_entry = marshal_write_data_to_body_without_entry(recipient);
     let body_part_hash = sha256_bytes(&body_without_entry);
@@ -777,7 +786,7 @@ fn marshal_write_data_to_body_without_entry(recipient: &str) -> Vec<u8> {
 ///
 /// Based on Go: protocol/data_entry.go
 /// DoubleHashDataEntry: SHA256(MerkleHash(SHA256(data1), SHA256(data2), ...))
-fn compute_data_entry_hash(entries_hex: &[String]) -> [u8; 32] {
+fn compute_data_entry_hash<S: AsRef<str>>(entries_hex: &[S]) -> [u8; 32] {
     if entries_hex.is_empty() {
         return [0u8; 32];
     }
@@ -785,7 +794,7 @@ fn compute_data_entry_hash(entries_hex: &[String]) -> [u8; 32] {
     // Collect SHA256 hashes of each data item
     let mut data_hashes: Vec<[u8; 32]> = Vec::new();
     for entry_hex in entries_hex {
-        if let Ok(data) = hex::decode(entry_hex) {
+        if let Ok(data) = hex::decode(entry_hex.as_ref()) {
             data_hashes.push(sha256_bytes(&data));
         }
     }
@@ -838,7 +847,7 @@ fn merkle_hash(hashes: &[[u8; 32]]) -> [u8; 32] {
             // but match on it rather than unwrap so the invariant is explicit
             // and a future edit cannot turn it into a panic in signing code.
             if let Some(existing) = pending[i] {
-                current = combine_hashes(&existing, &current);
+                current = sha256_pair(&existing, &current);
             }
             pending[i] = None;
             i += 1;
@@ -853,7 +862,7 @@ fn merkle_hash(hashes: &[[u8; 32]]) -> [u8; 32] {
             (None, _) => anchor = *v,
             // Both present: fold the slot into the running anchor. Matching on
             // the pair removes the unwrap without changing the fold order.
-            (Some(acc), Some(val)) => anchor = Some(combine_hashes(val, &acc)),
+            (Some(acc), Some(val)) => anchor = Some(sha256_pair(val, &acc)),
             (Some(_), None) => {}
         }
     }
@@ -861,14 +870,6 @@ fn merkle_hash(hashes: &[[u8; 32]]) -> [u8; 32] {
     anchor.unwrap_or([0u8; 32])
 }
 
-/// Combine two hashes: SHA256(left + right)
-fn combine_hashes(left: &[u8; 32], right: &[u8; 32]) -> [u8; 32] {
-    let mut combined = Vec::with_capacity(64);
-    combined.extend_from_slice(left);
-    combined.extend_from_slice(right);
-    sha256_bytes(&combined)
-}
-
 // =============================================================================
 // UPDATE KEY PAGE ENCODING
 // =============================================================================
@@ -1170,7 +1171,7 @@ fn marshal_credit_recipient(url: &str, amount: u64) -> Vec<u8> {
 /// - Field 1: Type (enum, 0x06)
 /// - Field 2: Recipient (URL)
 /// - Field 3: Entry (nested DataEntry)
-pub fn marshal_write_data_to_body(recipient: &str, entries_hex: &[String]) -> Vec<u8> {
+pub fn marshal_write_data_to_body<S: AsRef<str>>(recipient: &str, entries_hex: &[S]) -> Vec<u8> {
     let mut writer = BinaryWriter::new();
 
     // Field 1: Type (WriteDataTo = 0x06)
@@ -1324,6 +1325,11 @@ mod tests {
 
         let preimage = create_signing_preimage(&sig_hash, &tx_hash);
         assert_eq!(preimage.len(), 32);
+
+        // Fused hashing matches hashing the concatenated buffer
+        let mut combined = sig_hash.to_vec();
+        combined.extend_from_slice(&tx_hash);
+        assert_eq!(preimage, sha256_bytes(&combined));
     }
 
     #[test]
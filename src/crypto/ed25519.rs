@@ -1,26 +1,45 @@
 // Allow unwrap/expect in this module - cryptographic operations have controlled inputs
 #![allow(clippy::unwrap_used, clippy::expect_used)]
 
-use ed25519_dalek::{SigningKey, VerifyingKey, Signature, Signer, Verifier};
-use sha2::{Digest, Sha256};
+use curve25519_dalek::edwards::CompressedEdwardsY;
+use ed25519_dalek::hazmat::{raw_sign, ExpandedSecretKey};
+use ed25519_dalek::{Signature, SigningKey, Verifier, VerifyingKey};
+use sha2::{Digest, Sha256, Sha512};
+use std::sync::OnceLock;
 
 /// Ed25519 signer that exactly matches TypeScript SDK behavior
 /// Updated for ed25519-dalek v2.x API
 pub struct Ed25519Signer {
     signing_key: SigningKey,
+    /// SHA-512 expansion of the seed (scalar and nonce prefix), derived once
+    /// so signing does not rehash the seed on every call
+    expanded: ExpandedSecretKey,
+    /// Lite identity URL, derived on first use
+    lite_identity: OnceLock<String>,
+    /// Lite ACME token account URL, derived on first use
+    lite_token_account: OnceLock<String>,
 }
 
 impl std::fmt::Debug for Ed25519Signer {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         f.debug_struct("Ed25519Signer")
-            .field("public_key", &hex::encode(self.signing_key.verifying_key().as_bytes()))
+            .field(
+                "public_key",
+                &hex::encode(self.signing_key.verifying_key().as_bytes()),
+            )
             .finish_non_exhaustive()
     }
 }
 
 impl Ed25519Signer {
     pub fn new(signing_key: SigningKey) -> Self {
-        Self { signing_key }
+        let expanded = ExpandedSecretKey::from(signing_key.as_bytes());
+        Self {
+            signing_key,
+            expanded,
+            lite_identity: OnceLock::new(),
+            lite_token_account: OnceLock::new(),
+        }
     }
 
     /// Generate a new signing key from the operating system CSPRNG.
@@ -52,14 +71,15 @@ impl Ed25519Signer {
     /// Sign message and return 64-byte signature array (matches TS SDK)
     /// Returns [u8; 64] for exact byte-for-byte compatibility
     pub fn sign(&self, message: &[u8]) -> [u8; 64] {
-        let signature = self.signing_key.sign(message);
+        // Same signature SigningKey::sign produces, minus its per-call seed expansion
+        let signature =
+            raw_sign::<Sha512>(&self.expanded, message, &self.signing_key.verifying_key());
         signature.to_bytes()
     }
 
     /// Sign a pre-hashed message and return 64-byte signature array
     pub fn sign_prehashed(&self, hash: &[u8; 32]) -> [u8; 64] {
-        let signature = self.signing_key.sign(hash);
-        signature.to_bytes()
+        self.sign(hash)
     }
 
     /// Get verifying (public) key as reference
@@ -72,6 +92,18 @@ impl Ed25519Signer {
         self.signing_key.verifying_key().to_bytes()
     }
 
+    /// Lite identity URL for this key, computed once and cached
+    pub fn lite_identity_url(&self) -> &str {
+        self.lite_identity
+            .get_or_init(|| crate::helpers::derive_lite_identity_url(&self.public_key_bytes()))
+    }
+
+    /// Lite ACME token account URL for this key, computed once and cached
+    pub fn lite_token_account_url(&self) -> &str {
+        self.lite_token_account
+            .get_or_init(|| format!("{}/ACME", self.lite_identity_url()))
+    }
+
     /// Get private key (seed) as 32-byte array
     pub fn private_key_bytes(&self) -> [u8; 32] {
         self.signing_key.to_bytes()
@@ -91,36 +123,83 @@ impl Ed25519Signer {
 
 /// Verify Ed25519 signature (matches TS SDK)
 /// Returns true if signature is valid, false otherwise
-pub fn verify(
-    public_key: &[u8; 32],
-    message: &[u8],
-    signature: &[u8; 64],
-) -> bool {
-    match VerifyingKey::from_bytes(public_key) {
-        Ok(verifying_key) => {
-            match Signature::from_bytes(signature) {
-                sig => verifying_key.verify(message, &sig).is_ok(),
-            }
-        }
-        Err(_) => false,
-    }
+pub fn verify(public_key: &[u8; 32], message: &[u8], signature: &[u8; 64]) -> bool {
+    verify_signature(public_key, message, signature).is_ok()
 }
 
 /// Verify Ed25519 signature against pre-hashed message (matches TS SDK)
 /// Returns true if signature is valid, false otherwise
-pub fn verify_prehashed(
-    public_key: &[u8; 32],
-    hash: &[u8; 32],
-    signature: &[u8; 64],
-) -> bool {
-    match VerifyingKey::from_bytes(public_key) {
-        Ok(verifying_key) => {
-            match Signature::from_bytes(signature) {
-                sig => verifying_key.verify(hash, &sig).is_ok(),
-            }
+pub fn verify_prehashed(public_key: &[u8; 32], hash: &[u8; 32], signature: &[u8; 64]) -> bool {
+    verify_signature(public_key, hash, signature).is_ok()
+}
+
+/// Verify many Ed25519 signatures at once
+/// Returns one flag per signature, true where the signature is valid
+///
+/// Every flag is exactly what [`verify`] returns for that entry. The batch
+/// equation is a random linear combination, so a torsion component in a key
+/// or in `R` can cancel out of it even though the single check rejects the
+/// signature. Only entries whose key and `R` lie in the prime-order subgroup
+/// are batched, with a single multi-scalar multiplication; the rest, and
+/// every entry of a batch that fails, are checked one by one with
+/// [`verify`]. Entries past the end of the shortest input slice are reported
+/// as invalid.
+pub fn verify_batch(
+    public_keys: &[[u8; 32]],
+    messages: &[&[u8]],
+    signatures: &[[u8; 64]],
+) -> Vec<bool> {
+    let len = public_keys.len().max(messages.len()).max(signatures.len());
+    let mut results = vec![false; len];
+
+    let mut indices = Vec::with_capacity(len);
+    let mut keys = Vec::with_capacity(len);
+    let mut msgs = Vec::with_capacity(len);
+    let mut sigs = Vec::with_capacity(len);
+    for (i, ((public_key, message), signature)) in
+        public_keys.iter().zip(messages).zip(signatures).enumerate()
+    {
+        // Undecodable keys can never verify
+        let Ok(verifying_key) = VerifyingKey::from_bytes(public_key) else {
+            continue;
+        };
+        let sig = Signature::from_bytes(signature);
+        if batchable(public_key, &sig) {
+            indices.push(i);
+            keys.push(verifying_key);
+            msgs.push(*message);
+            sigs.push(sig);
+        } else {
+            results[i] = verifying_key.verify(message, &sig).is_ok();
+        }
+    }
+
+    if ed25519_dalek::verify_batch(&msgs, &sigs, &keys).is_ok() {
+        for i in indices {
+            results[i] = true;
+        }
+    } else {
+        for (j, i) in indices.into_iter().enumerate() {
+            results[i] = keys[j].verify(msgs[j], &sigs[j]).is_ok();
         }
-        Err(_) => false,
     }
+
+    results
+}
+
+/// True if the batch equation and [`verify`] agree on this entry: the key and
+/// `R` are canonically encoded, not of small order and free of torsion
+fn batchable(public_key: &[u8; 32], signature: &Signature) -> bool {
+    let in_prime_subgroup = |bytes: &[u8; 32]| {
+        CompressedEdwardsY(*bytes)
+            .decompress()
+            .is_some_and(|point| {
+                point.compress().as_bytes() == bytes
+                    && !point.is_small_order()
+                    && point.is_torsion_free()
+            })
+    };
+    in_prime_subgroup(public_key) && in_prime_subgroup(signature.r_bytes())
 }
 
 /// Legacy verify function for backwards compatibility
@@ -140,16 +219,12 @@ pub fn verify_signature_prehashed(
     hash: &[u8; 32],
     signature: &[u8; 64],
 ) -> Result<(), ed25519_dalek::SignatureError> {
-    let verifying_key = VerifyingKey::from_bytes(public_key)?;
-    let sig = Signature::from_bytes(signature);
-    verifying_key.verify(hash, &sig)
+    verify_signature(public_key, hash, signature)
 }
 
 /// Hash message with SHA-256
 pub fn sha256(message: &[u8]) -> [u8; 32] {
-    let mut hasher = Sha256::new();
-    hasher.update(message);
-    hasher.finalize().into()
+    Sha256::digest(message).into()
 }
 
 /// Hash message and return as hex string
@@ -192,6 +267,40 @@ mod tests {
         assert_eq!(signer.public_key_bytes(), signer2.public_key_bytes());
     }
 
+    #[test]
+    fn test_sign_matches_signing_key() {
+        use ed25519_dalek::Signer;
+
+        let seed = [7u8; 32];
+        let signer = Ed25519Signer::from_seed(&seed).unwrap();
+        let message = b"expanded key signing";
+
+        assert_eq!(
+            signer.sign(message),
+            SigningKey::from_bytes(&seed).sign(message).to_bytes()
+        );
+    }
+
+    #[test]
+    fn test_cached_lite_urls() {
+        let signer = Ed25519Signer::from_seed(&[3u8; 32]).unwrap();
+        let public_key = signer.public_key_bytes();
+
+        assert_eq!(
+            signer.lite_identity_url(),
+            crate::helpers::derive_lite_identity_url(&public_key)
+        );
+        assert_eq!(
+            signer.lite_token_account_url(),
+            crate::helpers::derive_lite_token_account_url(&public_key)
+        );
+        // Repeat calls hand back the cached string
+        assert!(std::ptr::eq(
+            signer.lite_identity_url(),
+            signer.lite_identity_url()
+        ));
+    }
+
     #[test]
     fn test_sign_returns_64_bytes() {
         let seed = [1u8; 32];
@@ -221,4 +330,134 @@ mod tests {
         let wrong_signature = [0u8; 64];
         assert!(!verify(&public_key, message, &wrong_signature));
     }
+
+    #[test]
+    fn test_verify_batch() {
+        let signers: Vec<Ed25519Signer> = (0u8..4)
+            .map(|i| Ed25519Signer::from_seed(&[i; 32]).unwrap())
+            .collect();
+        let messages: Vec<&[u8]> = vec![b"tx-0", b"tx-1", b"tx-2", b"tx-3"];
+        let public_keys: Vec<[u8; 32]> = signers.iter().map(|s| s.public_key_bytes()).collect();
+        let mut signatures: Vec<[u8; 64]> = signers
+            .iter()
+            .zip(&messages)
+            .map(|(s, m)| s.sign(m))
+            .collect();
+
+        assert_eq!(
+            verify_batch(&public_keys, &messages, &signatures),
+            vec![true; 4]
+        );
+
+        // A bad signature is pinpointed without failing the rest
+        signatures[2] = signers[2].sign(b"something else");
+        assert_eq!(
+            verify_batch(&public_keys, &messages, &signatures),
+            vec![true, true, false, true]
+        );
+
+        // Missing entries are reported as invalid
+        assert_eq!(
+            verify_batch(&public_keys, &messages[..3], &signatures),
+            vec![true, true, false, false]
+        );
+        assert!(verify_batch(&[], &[], &[]).is_empty());
+    }
+
+    /// Order-8 point, a weak public key
+    const SMALL_ORDER_POINT: &str =
+        "c7176a703d4dd84fba3c0b760d10670f2a2053fa2c39ccc64ec7fd7792ac037a";
+
+    /// Each entry batched alone and all entries batched together must give
+    /// exactly what verify says for that entry
+    fn assert_batch_matches_single(
+        public_keys: &[[u8; 32]],
+        messages: &[&[u8]],
+        signatures: &[[u8; 64]],
+    ) {
+        let expected: Vec<bool> = public_keys
+            .iter()
+            .zip(messages)
+            .zip(signatures)
+            .map(|((pk, m), sig)| verify(pk, m, sig))
+            .collect();
+        for (i, ok) in expected.iter().enumerate() {
+            assert_eq!(
+                verify_batch(&public_keys[i..=i], &messages[i..=i], &signatures[i..=i]),
+                vec![*ok]
+            );
+        }
+        assert_eq!(verify_batch(public_keys, messages, signatures), expected);
+    }
+
+    #[test]
+    fn test_verify_batch_small_order_key_matches_verify() {
+        let weak_key: [u8; 32] = hex::decode(SMALL_ORDER_POINT).unwrap().try_into().unwrap();
+        // R = B, s = 1 satisfies the cofactorless equation under this key
+        // whenever H(R || A || M) is a multiple of 8
+        let mut forged = [0u8; 64];
+        forged[..32]
+            .copy_from_slice(curve25519_dalek::constants::ED25519_BASEPOINT_COMPRESSED.as_bytes());
+        forged[32] = 1;
+
+        let honest = Ed25519Signer::from_seed(&[9u8; 32]).unwrap();
+        let messages: Vec<Vec<u8>> = (0..64).map(|i| format!("msg-{i}").into_bytes()).collect();
+        let messages: Vec<&[u8]> = messages.iter().map(|m| m.as_slice()).collect();
+        let mut public_keys = Vec::new();
+        let mut signatures = Vec::new();
+        for (i, message) in messages.iter().enumerate() {
+            if i % 2 == 0 {
+                public_keys.push(weak_key);
+                signatures.push(forged);
+            } else {
+                public_keys.push(honest.public_key_bytes());
+                signatures.push(honest.sign(message));
+            }
+        }
+
+        assert_batch_matches_single(&public_keys, &messages, &signatures);
+        // The honest half verifies whatever the forgeries do
+        assert!(verify_batch(&public_keys, &messages, &signatures)
+            .iter()
+            .skip(1)
+            .step_by(2)
+            .all(|ok| *ok));
+    }
+
+    #[test]
+    fn test_verify_batch_mixed_torsion_key_matches_verify() {
+        use curve25519_dalek::edwards::CompressedEdwardsY;
+
+        // A valid key plus an order-8 component: not weak, but not torsion-free
+        let seed = [5u8; 32];
+        let signer = Ed25519Signer::from_seed(&seed).unwrap();
+        let small = CompressedEdwardsY(hex::decode(SMALL_ORDER_POINT).unwrap().try_into().unwrap())
+            .decompress()
+            .unwrap();
+        let point = CompressedEdwardsY(signer.public_key_bytes())
+            .decompress()
+            .unwrap();
+        let mixed_key = (point + small).compress().to_bytes();
+        let verifying_key = VerifyingKey::from_bytes(&mixed_key).unwrap();
+        assert!(!verifying_key.is_weak());
+
+        // Signing with the honest scalar verifies under the mixed key only
+        // when the torsion term k·T vanishes
+        let expanded = ExpandedSecretKey::from(&seed);
+        let messages: Vec<Vec<u8>> = (0..64).map(|i| format!("msg-{i}").into_bytes()).collect();
+        let messages: Vec<&[u8]> = messages.iter().map(|m| m.as_slice()).collect();
+        let signatures: Vec<[u8; 64]> = messages
+            .iter()
+            .map(|m| raw_sign::<Sha512>(&expanded, m, &verifying_key).to_bytes())
+            .collect();
+        let public_keys = vec![mixed_key; messages.len()];
+
+        assert_batch_matches_single(&public_keys, &messages, &signatures);
+        // Some, but not all, of these pass the single check
+        let accepted = verify_batch(&public_keys, &messages, &signatures)
+            .iter()
+            .filter(|ok| **ok)
+            .count();
+        assert!(accepted > 0 && accepted < messages.len());
+    }
 }
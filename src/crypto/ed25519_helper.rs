@@ -8,10 +8,10 @@
 // Allow expect in this module - cryptographic operations have controlled inputs
 #![allow(clippy::expect_used)]
 
-use crate::crypto::ed25519::{Ed25519Signer, verify_signature, sha256};
-use crate::codec::{canonical_json, sha256_bytes};
+use crate::crypto::ed25519::sha256;
+use crate::codec::canonical_json_bytes;
 use crate::errors::{Error, SignatureError};
-use ed25519_dalek::{SigningKey, VerifyingKey, Signature};
+use ed25519_dalek::{SigningKey, VerifyingKey, Signature, Signer, Verifier};
 use serde_json::Value;
 
 /// Wrapper around ed25519_dalek::SigningKey to provide a convenient API
@@ -31,10 +31,11 @@ impl std::fmt::Debug for Keypair {
 
 impl Clone for Keypair {
     fn clone(&self) -> Self {
-        // In v2, we can clone from the seed bytes
-        let seed_bytes = self.inner.to_bytes();
-        let signing_key = SigningKey::from_bytes(&seed_bytes);
-        Self::new(signing_key)
+        // Copy both halves; rebuilding from the seed would redo the public key derivation
+        Self {
+            inner: self.inner.clone(),
+            public: self.public,
+        }
     }
 }
 
@@ -58,21 +59,35 @@ pub struct Ed25519Helper;
 impl Ed25519Helper {
     /// Create a keypair from a hex-encoded private key
     /// This uses standard Ed25519 seed-based key generation to match test vectors
+    ///
+    /// Accepts either a 32-byte seed or a 64-byte seed || public key, the form
+    /// Go's crypto/ed25519 stores. The public half of a 64-byte key must match
+    /// the key derived from its seed.
     pub fn keypair_from_hex(hex_key: &str) -> Result<Keypair, Error> {
         let bytes = hex::decode(hex_key)
             .map_err(|_| Error::Signature(SignatureError::InvalidFormat))?;
 
-        if bytes.len() != 32 {
-            return Err(Error::Signature(SignatureError::InvalidFormat));
+        match bytes.len() {
+            32 => {
+                let mut seed = [0u8; 32];
+                seed.copy_from_slice(&bytes);
+
+                // Use standard Ed25519 seed-based key generation
+                // This matches Go's crypto/ed25519.NewKeyFromSeed() behavior
+                let signing_key = SigningKey::from_bytes(&seed);
+                Ok(Keypair::new(signing_key))
+            }
+            64 => {
+                let mut keypair_bytes = [0u8; 64];
+                keypair_bytes.copy_from_slice(&bytes);
+
+                // Rejects a public half that does not belong to the seed
+                let signing_key = SigningKey::from_keypair_bytes(&keypair_bytes)
+                    .map_err(|_| Error::Signature(SignatureError::InvalidPublicKey))?;
+                Ok(Keypair::new(signing_key))
+            }
+            _ => Err(Error::Signature(SignatureError::InvalidFormat)),
         }
-
-        let mut seed = [0u8; 32];
-        seed.copy_from_slice(&bytes);
-
-        // Use standard Ed25519 seed-based key generation
-        // This matches Go's crypto/ed25519.NewKeyFromSeed() behavior
-        let signing_key = SigningKey::from_bytes(&seed);
-        Ok(Keypair::new(signing_key))
     }
 
     /// Get public key bytes from a keypair
@@ -94,39 +109,32 @@ impl Ed25519Helper {
 
     /// Sign JSON data with a keypair
     pub fn sign_json(keypair: &Keypair, json_data: &Value) -> Signature {
-        let canonical = canonical_json(json_data);
-        let message_bytes = canonical.as_bytes();
-
-        // Use the Ed25519Signer to maintain consistency
-        let cloned_keypair = keypair.clone();
-        let signer = Ed25519Signer::new(cloned_keypair.inner);
-        let sig_bytes = signer.sign(message_bytes);
-
-        // Convert [u8; 64] to Signature
-        Signature::from_bytes(&sig_bytes)
+        let canonical = canonical_json_bytes(json_data);
+        Self::sign_bytes(keypair, &canonical)
     }
 
     /// Verify a signature against JSON data
     pub fn verify_json(public_key: &VerifyingKey, json_data: &Value, signature: &Signature) -> Result<(), Error> {
-        let canonical = canonical_json(json_data);
-        let message_bytes = canonical.as_bytes();
+        let canonical = canonical_json_bytes(json_data);
 
-        verify_signature(&public_key.to_bytes(), message_bytes, &signature.to_bytes())
+        public_key
+            .verify(&canonical, signature)
             .map_err(|_| Error::Signature(SignatureError::VerificationFailed("JSON signature verification failed".to_string())))
     }
 
     /// Verify a signature against raw data
     pub fn verify(public_key: &VerifyingKey, message: &[u8], signature: &Signature) -> Result<(), Error> {
-        verify_signature(&public_key.to_bytes(), message, &signature.to_bytes())
+        // Use the already-decompressed key rather than round-tripping it through bytes
+        public_key
+            .verify(message, signature)
             .map_err(|_| Error::Signature(SignatureError::VerificationFailed("Raw signature verification failed".to_string())))
     }
 
     /// Sign raw bytes with a keypair
     pub fn sign_bytes(keypair: &Keypair, message: &[u8]) -> Signature {
-        let cloned_keypair = keypair.clone();
-        let signer = Ed25519Signer::new(cloned_keypair.inner);
-        let sig_bytes = signer.sign(message);
-        Signature::from_bytes(&sig_bytes)
+        // Sign with the keypair's own key; cloning it into a fresh signer
+        // re-derived the public key on every call
+        keypair.inner.sign(message)
     }
 
     /// Get private key bytes from keypair
@@ -147,8 +155,7 @@ impl Ed25519Helper {
 
     /// Hash JSON data using SHA-256
     pub fn sha256_json(json_data: &Value) -> [u8; 32] {
-        let canonical = canonical_json(json_data);
-        sha256_bytes(canonical.as_bytes())
+        crate::canonjson::canonical_sha256(json_data)
     }
 
     /// Get hex representation of public key
@@ -177,6 +184,21 @@ mod tests {
         assert_eq!(pub_key_bytes.len(), 32);
     }
 
+    #[test]
+    fn test_keypair_from_hex_64_bytes() {
+        let seed_hex = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef";
+        let keypair = Ed25519Helper::keypair_from_hex(seed_hex).unwrap();
+        let public_hex = hex::encode(Ed25519Helper::public_key_bytes(&keypair));
+
+        let full = Ed25519Helper::keypair_from_hex(&format!("{}{}", seed_hex, public_hex)).unwrap();
+        assert_eq!(Ed25519Helper::public_key_bytes(&full), Ed25519Helper::public_key_bytes(&keypair));
+
+        // A public half from a different key is rejected
+        let mismatched = format!("{}{}", seed_hex, "11".repeat(32));
+        assert!(Ed25519Helper::keypair_from_hex(&mismatched).is_err());
+        assert!(Ed25519Helper::keypair_from_hex(&seed_hex[..62]).is_err());
+    }
+
     #[test]
     fn test_sign_and_verify_json() {
         let hex_key = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef";
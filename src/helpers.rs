@@ -15,7 +15,6 @@ use crate::AccOptions;
 use ed25519_dalek::{SigningKey, Signer};
 use serde::{Deserialize, Serialize};
 use serde_json::{json, Value};
-use sha2::{Digest, Sha256};
 use std::time::{Duration, SystemTime, UNIX_EPOCH};
 use url::Url;
 
@@ -495,6 +494,7 @@ impl<'a> SmartSigner<'a> {
             create_signing_preimage,
             marshal_transaction_header,
             sha256_bytes,
+            sha256_pair,
         };
 
         let timestamp = SystemTime::now()
@@ -526,44 +526,21 @@ impl<'a> SmartSigner<'a> {
         // WriteData/WriteDataTo use special Merkle hash algorithm
         let tx_type = body.get("type").and_then(|t| t.as_str()).unwrap_or("");
 
-        // Helper: extract entries from body.entry.data
-        let extract_entries = |body: &Value| -> Vec<String> {
-            let mut entries_hex = Vec::new();
-            if let Some(entry) = body.get("entry") {
-                if let Some(data) = entry.get("data") {
-                    if let Some(arr) = data.as_array() {
-                        for item in arr {
-                            if let Some(s) = item.as_str() {
-                                entries_hex.push(s.to_string());
-                            }
-                        }
-                    }
-                }
-            }
-            entries_hex
-        };
-
         let tx_hash = if tx_type == "writeData" {
             let header_hash = sha256_bytes(&header_bytes);
-            let entries_hex = extract_entries(body);
+            let entries_hex = write_data_entries(body);
             let scratch = body.get("scratch").and_then(|s| s.as_bool()).unwrap_or(false);
             let write_to_state = body.get("writeToState").and_then(|w| w.as_bool()).unwrap_or(false);
             let body_hash = compute_write_data_body_hash(&entries_hex, scratch, write_to_state);
             // txHash = SHA256(SHA256(header) + bodyHash)
-            let mut combined = Vec::with_capacity(64);
-            combined.extend_from_slice(&header_hash);
-            combined.extend_from_slice(&body_hash);
-            sha256_bytes(&combined)
+            sha256_pair(&header_hash, &body_hash)
         } else if tx_type == "writeDataTo" {
             let header_hash = sha256_bytes(&header_bytes);
-            let entries_hex = extract_entries(body);
+            let entries_hex = write_data_entries(body);
             let recipient = body.get("recipient").and_then(|r| r.as_str()).unwrap_or("");
             let body_hash = compute_write_data_to_body_hash(recipient, &entries_hex);
             // txHash = SHA256(SHA256(header) + bodyHash)
-            let mut combined = Vec::with_capacity(64);
-            combined.extend_from_slice(&header_hash);
-            combined.extend_from_slice(&body_hash);
-            sha256_bytes(&combined)
+            sha256_pair(&header_hash, &body_hash)
         } else {
             // Standard: SHA256(SHA256(header) + SHA256(body))
             let body_bytes = marshal_body_to_binary(body)?;
@@ -863,6 +840,7 @@ impl<'a> SmartSigner<'a> {
             marshal_transaction_header_full,
             HeaderBinaryOptions,
             sha256_bytes,
+            sha256_pair,
         };
 
         let timestamp = SystemTime::now()
@@ -911,42 +889,19 @@ impl<'a> SmartSigner<'a> {
         // Step 3 & 4: Compute transaction hash
         let tx_type = body.get("type").and_then(|t| t.as_str()).unwrap_or("");
 
-        // Helper: extract entries from body.entry.data
-        let extract_entries = |body: &Value| -> Vec<String> {
-            let mut entries_hex = Vec::new();
-            if let Some(entry) = body.get("entry") {
-                if let Some(data) = entry.get("data") {
-                    if let Some(arr) = data.as_array() {
-                        for item in arr {
-                            if let Some(s) = item.as_str() {
-                                entries_hex.push(s.to_string());
-                            }
-                        }
-                    }
-                }
-            }
-            entries_hex
-        };
-
         let tx_hash = if tx_type == "writeData" {
             let header_hash = sha256_bytes(&header_bytes);
-            let entries_hex = extract_entries(body);
+            let entries_hex = write_data_entries(body);
             let scratch = body.get("scratch").and_then(|s| s.as_bool()).unwrap_or(false);
             let write_to_state = body.get("writeToState").and_then(|w| w.as_bool()).unwrap_or(false);
             let body_hash = compute_write_data_body_hash(&entries_hex, scratch, write_to_state);
-            let mut combined = Vec::with_capacity(64);
-            combined.extend_from_slice(&header_hash);
-            combined.extend_from_slice(&body_hash);
-            sha256_bytes(&combined)
+            sha256_pair(&header_hash, &body_hash)
         } else if tx_type == "writeDataTo" {
             let header_hash = sha256_bytes(&header_bytes);
-            let entries_hex = extract_entries(body);
+            let entries_hex = write_data_entries(body);
             let recipient = body.get("recipient").and_then(|r| r.as_str()).unwrap_or("");
             let body_hash = compute_write_data_to_body_hash(recipient, &entries_hex);
-            let mut combined = Vec::with_capacity(64);
-            combined.extend_from_slice(&header_hash);
-            combined.extend_from_slice(&body_hash);
-            sha256_bytes(&combined)
+            sha256_pair(&header_hash, &body_hash)
         } else {
             let body_bytes = marshal_body_to_binary(body)?;
             compute_transaction_hash(&header_bytes, &body_bytes)
@@ -1139,6 +1094,18 @@ fn append_authorities(mut bytes: Vec<u8>, body: &Value, field_nr: u64) -> Vec<u8
     bytes
 }
 
+/// Borrow the hex data items from a WriteData/WriteDataTo body's `entry.data`
+///
+/// The strings are hashed and marshaled straight from the body, so nothing is
+/// copied out of it first.
+fn write_data_entries(body: &Value) -> Vec<&str> {
+    body.get("entry")
+        .and_then(|entry| entry.get("data"))
+        .and_then(Value::as_array)
+        .map(|data| data.iter().filter_map(Value::as_str).collect())
+        .unwrap_or_default()
+}
+
 /// Marshal a transaction body to its signing bytes.
 ///
 /// Exposed so the byte layout can be compared against the other SDKs: a field
@@ -1212,19 +1179,7 @@ fn marshal_body_to_binary(body: &Value) -> Result<Vec<u8>, JsonRpcError> {
             Ok(marshal_create_data_account_body(url, &authorities))
         }
         "writeData" => {
-            // Extract entries from nested entry.data structure
-            let mut entries_hex = Vec::new();
-            if let Some(entry) = body.get("entry") {
-                if let Some(data) = entry.get("data") {
-                    if let Some(arr) = data.as_array() {
-                        for item in arr {
-                            if let Some(s) = item.as_str() {
-                                entries_hex.push(s.to_string());
-                            }
-                        }
-                    }
-                }
-            }
+            let entries_hex = write_data_entries(body);
             let scratch = body.get("scratch").and_then(|s| s.as_bool()).unwrap_or(false);
             let write_to_state = body.get("writeToState").and_then(|w| w.as_bool()).unwrap_or(false);
             Ok(marshal_write_data_body(&entries_hex, scratch, write_to_state))
@@ -1356,18 +1311,7 @@ fn marshal_body_to_binary(body: &Value) -> Result<Vec<u8>, JsonRpcError> {
         }
         "writeDataTo" => {
             let recipient = body.get("recipient").and_then(|r| r.as_str()).unwrap_or("");
-            let mut entries_hex = Vec::new();
-            if let Some(entry) = body.get("entry") {
-                if let Some(data) = entry.get("data") {
-                    if let Some(arr) = data.as_array() {
-                        for item in arr {
-                            if let Some(s) = item.as_str() {
-                                entries_hex.push(s.to_string());
-                            }
-                        }
-                    }
-                }
-            }
+            let entries_hex = write_data_entries(body);
             Ok(marshal_write_data_to_body(recipient, &entries_hex))
         }
         "lockAccount" => {
@@ -1983,34 +1927,52 @@ impl QuickStart {
 ///
 /// Note: Lite addresses do NOT have .acme suffix!
 pub fn derive_lite_identity_url(public_key: &[u8; 32]) -> String {
-    // Get first 20 bytes of SHA256(publicKey)
-    let hash = sha256_hash(public_key);
-    let key_hash_20 = &hash[0..20];
-
-    // Convert to hex string
-    let key_hash_hex = hex::encode(key_hash_20);
-
-    // Compute checksum: SHA256(keyHashHex)[28..32]
-    let checksum_full = sha256_hash(key_hash_hex.as_bytes());
-    let checksum_hex = hex::encode(&checksum_full[28..32]);
-
-    // Format: acc://[keyHash][checksum]
-    format!("acc://{}{}", key_hash_hex, checksum_hex)
+    let url = encode_lite_identity(public_key);
+    std::str::from_utf8(&url)
+        .expect("Lite identity URL is ASCII")
+        .to_owned()
 }
 
 /// Derive lite token account URL from public key
 ///
 /// Format: acc://[40 hex key hash][8 hex checksum]/ACME
 pub fn derive_lite_token_account_url(public_key: &[u8; 32]) -> String {
-    let lite_identity = derive_lite_identity_url(public_key);
-    format!("{}/ACME", lite_identity)
+    let identity = encode_lite_identity(public_key);
+    let mut url = String::with_capacity(LITE_IDENTITY_URL_LEN + "/ACME".len());
+    url.push_str(std::str::from_utf8(&identity).expect("Lite identity URL is ASCII"));
+    url.push_str("/ACME");
+    url
+}
+
+/// Length of `acc://` plus the 40 hex key hash and 8 hex checksum characters
+const LITE_IDENTITY_URL_LEN: usize = 6 + 40 + 8;
+
+/// Encode the lite identity URL into a fixed stack buffer
+///
+/// The hex digits are written in place and the checksum is hashed straight
+/// from that buffer, so no intermediate strings are allocated.
+fn encode_lite_identity(public_key: &[u8; 32]) -> [u8; LITE_IDENTITY_URL_LEN] {
+    let mut url = [0u8; LITE_IDENTITY_URL_LEN];
+    let (scheme, rest) = url.split_at_mut(6);
+    let (key_hash_hex, checksum_hex) = rest.split_at_mut(40);
+    scheme.copy_from_slice(b"acc://");
+
+    // Key hash: first 20 bytes of SHA256(publicKey) as hex
+    let hash = sha256_hash(public_key);
+    hex::encode_to_slice(&hash[0..20], key_hash_hex)
+        .expect("Buffer sized for 20 hex-encoded bytes");
+
+    // Checksum: SHA256(keyHashHex)[28..32] as hex
+    let checksum_full = sha256_hash(key_hash_hex);
+    hex::encode_to_slice(&checksum_full[28..32], checksum_hex)
+        .expect("Buffer sized for 4 hex-encoded bytes");
+
+    url
 }
 
 /// SHA-256 hash helper
 pub fn sha256_hash(data: &[u8]) -> [u8; 32] {
-    let mut hasher = Sha256::new();
-    hasher.update(data);
-    hasher.finalize().into()
+    crate::codec::sha256_bytes(data)
 }
 
 /// Extract transaction ID from submit response
@@ -2160,6 +2122,14 @@ mod tests {
         // Format: acc://[40 hex][8 hex checksum]
         let path = url.strip_prefix("acc://").unwrap();
         assert_eq!(path.len(), 48); // 40 + 8 hex chars
+        assert_eq!(
+            url,
+            "acc://72cd6e8422c407fb6d098690f1130b7ded7ec2f76aee7d70"
+        );
+        assert_eq!(
+            derive_lite_token_account_url(&public_key),
+            format!("{}/ACME", url)
+        );
     }
 
     #[test]
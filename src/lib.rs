@@ -18,10 +18,12 @@ pub type Accumulate = AccumulateClient;
 pub use crate::codec::{
     TransactionCodec, TransactionEnvelope, TransactionSignature,
     TransactionBodyBuilder, TokenRecipient, KeySpec, BinaryReader, BinaryWriter,
-    AccumulateHash, UrlHash, canonical_json, sha256_bytes, to_canonical_string
+    AccumulateHash, UrlHash, canonical_json, canonical_json_bytes, sha256_bytes, to_canonical_string
 };
-pub use crate::canonjson::{dumps_canonical, canonicalize};
-pub use crate::crypto::ed25519::{Ed25519Signer, verify, verify_prehashed, verify_signature, sha256};
+pub use crate::canonjson::{
+    dumps_canonical, canonicalize, canonicalize_bytes, canonical_sha256, hash_canonical_bytes,
+};
+pub use crate::crypto::ed25519::{Ed25519Signer, verify, verify_batch, verify_prehashed, verify_signature, sha256};
 pub use crate::crypto::ed25519_helper::Ed25519Helper;
 pub use crate::codec::hash_helper::HashHelper;
 pub use crate::protocol::{EnvelopeBuilder, helpers as protocol_helpers};
@@ -5,7 +5,8 @@
 
 #![allow(missing_docs)]
 
-use crate::codec::{canonical_json, sha256_bytes};
+use crate::canonjson::canonical_sha256;
+use crate::codec::{canonical_json, HashHelper};
 use crate::crypto::ed25519_helper::{Ed25519Helper, Keypair};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
@@ -72,10 +73,8 @@ impl EnvelopeBuilder {
     ) -> Result<TransactionEnvelope, EnvelopeError> {
         // Serialize transaction to canonical JSON
         let tx_value = serde_json::to_value(&transaction)?;
-        let canonical = canonical_json(&tx_value);
-
         // Hash the canonical transaction
-        let tx_hash = sha256_bytes(canonical.as_bytes());
+        let tx_hash = canonical_sha256(&tx_value);
         let tx_hash_hex = hex::encode(tx_hash);
 
         // Sign the transaction hash
@@ -162,16 +161,23 @@ impl EnvelopeBuilder {
 
         // Recreate transaction hash
         let tx_value = serde_json::to_value(transaction)?;
-        let canonical = canonical_json(&tx_value);
-        let computed_hash = hex::encode(sha256_bytes(canonical.as_bytes()));
-
-        // Verify hash matches
-        if computed_hash != signature.transaction_hash {
-            return Err(EnvelopeError::HashMismatch {
-                expected: signature.transaction_hash.clone(),
-                computed: computed_hash,
-            });
-        }
+        let computed_hash = canonical_sha256(&tx_value);
+
+        // Verify hash matches, comparing digests rather than hex strings. Only
+        // lowercase hex is accepted, as when the hex strings were compared
+        let lowercase = !signature
+            .transaction_hash
+            .bytes()
+            .any(|b| b.is_ascii_uppercase());
+        let tx_hash_bytes = match HashHelper::decode_digest(&signature.transaction_hash) {
+            Ok(expected) if lowercase && expected == computed_hash => expected,
+            _ => {
+                return Err(EnvelopeError::HashMismatch {
+                    expected: signature.transaction_hash.clone(),
+                    computed: hex::encode(computed_hash),
+                });
+            }
+        };
 
         // Verify signature
         let public_key_bytes = hex::decode(&signature.public_key)
@@ -195,9 +201,6 @@ impl EnvelopeBuilder {
         let signature_obj = Ed25519Helper::signature_from_bytes(&sig_array)
             .map_err(|e| EnvelopeError::InvalidSignature(e.to_string()))?;
 
-        let tx_hash_bytes = hex::decode(&signature.transaction_hash)
-            .map_err(|e| EnvelopeError::InvalidSignature(e.to_string()))?;
-
         Ed25519Helper::verify(&public_key, &tx_hash_bytes, &signature_obj)
             .map_err(|e| EnvelopeError::VerificationFailed(e.to_string()))?;
 
@@ -334,6 +337,28 @@ mod tests {
         assert!(result.is_ok());
     }
 
+    #[test]
+    fn test_envelope_verification_rejects_uppercase_hash() {
+        let hex_key = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef";
+        let keypair = Ed25519Helper::keypair_from_hex(hex_key).unwrap();
+
+        let body = helpers::create_send_tokens_body("acc://bob.acme/tokens", "1000", None);
+
+        let mut envelope = EnvelopeBuilder::create_envelope_from_json(
+            "acc://alice.acme/tokens",
+            body,
+            &keypair,
+            "acc://alice.acme/book/1",
+            1,
+        )
+        .unwrap();
+        envelope.signatures[0].transaction_hash =
+            envelope.signatures[0].transaction_hash.to_uppercase();
+
+        let result = EnvelopeBuilder::verify_envelope(&envelope);
+        assert!(matches!(result, Err(EnvelopeError::HashMismatch { .. })));
+    }
+
     #[test]
     fn test_transaction_helpers() {
         let send_body = helpers::create_send_tokens_body("acc://recipient", "500", None);
@@ -345,4 +370,4 @@ mod tests {
         let credits_body = helpers::create_add_credits_body("acc://recipient", 1000, None);
         assert_eq!(credits_body["type"], "addCredits");
     }
-}
\ No newline at end of file
+}
@@ -2,12 +2,7 @@ use sha2::{Digest, Sha256};
 
 /// Compute SHA-256 hash of input data
 pub fn sha256(data: &[u8]) -> [u8; 32] {
-    let mut hasher = Sha256::new();
-    hasher.update(data);
-    let out = hasher.finalize();
-    let mut arr = [0u8; 32];
-    arr.copy_from_slice(&out);
-    arr
+    Sha256::digest(data).into()
 }
 
 /// Compute SHA-256 hash and return as hex string
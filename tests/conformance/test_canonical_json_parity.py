@@ -5,6 +5,7 @@ This test suite validates that the Python canonical JSON implementation produces
 identical output to the Dart and TypeScript SDKs using golden fixture files.
 """
 
+import functools
 import json
 import hashlib
 import os
@@ -18,45 +19,34 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from accumulate_client.canonjson import dumps_canonical, canonicalize_for_hashing, compare_with_dart_output
 
 
+@functools.lru_cache(maxsize=None)
+def _load_fixture(path):
+    """Parse a golden fixture file once per process; None if it does not exist."""
+    if not path.exists():
+        return None
+    return json.loads(path.read_bytes())
+
+
+GOLDEN_DIR = Path(__file__).parent.parent / "golden"
+
+# Per-case fixtures, loaded at import so each case becomes its own test item
+_CANONICAL_CASES = (_load_fixture(GOLDEN_DIR / "canonical_json_tests.json") or {}).get("testCases", [])
+_TS_PARITY_FIXTURES = (_load_fixture(GOLDEN_DIR / "ts_parity_fixtures.json") or {}).get("fixtures", [])
+
+
 class TestCanonicalJsonParity:
     """Test canonical JSON implementation against golden fixtures."""
 
     @classmethod
     def setup_class(cls):
         """Load golden fixture files."""
-        cls.golden_dir = Path(__file__).parent.parent / "golden"
-
-        # Load canonical JSON test cases
-        canonical_json_file = cls.golden_dir / "canonical_json_tests.json"
-        if canonical_json_file.exists():
-            with open(canonical_json_file, 'r', encoding='utf-8') as f:
-                cls.canonical_json_fixtures = json.load(f)
-        else:
-            cls.canonical_json_fixtures = {"testCases": []}
+        cls.golden_dir = GOLDEN_DIR
 
         # Load transaction signing vectors
-        tx_signing_file = cls.golden_dir / "tx_signing_vectors.json"
-        if tx_signing_file.exists():
-            with open(tx_signing_file, 'r', encoding='utf-8') as f:
-                cls.tx_signing_fixtures = json.load(f)
-        else:
-            cls.tx_signing_fixtures = {"vectors": []}
+        cls.tx_signing_fixtures = _load_fixture(cls.golden_dir / "tx_signing_vectors.json") or {"vectors": []}
 
         # Load envelope fixtures
-        envelope_file = cls.golden_dir / "envelope_fixed.golden.json"
-        if envelope_file.exists():
-            with open(envelope_file, 'r', encoding='utf-8') as f:
-                cls.envelope_fixtures = json.load(f)
-        else:
-            cls.envelope_fixtures = {}
-
-        # Try to load ts_parity_fixtures.json if it exists
-        ts_parity_file = cls.golden_dir / "ts_parity_fixtures.json"
-        if ts_parity_file.exists():
-            with open(ts_parity_file, 'r', encoding='utf-8') as f:
-                cls.ts_parity_fixtures = json.load(f)
-        else:
-            cls.ts_parity_fixtures = {"fixtures": []}
+        cls.envelope_fixtures = _load_fixture(cls.golden_dir / "envelope_fixed.golden.json") or {}
 
     def test_basic_canonical_json_cases(self):
         """Test basic canonical JSON formatting against known expected outputs."""
@@ -87,18 +77,15 @@ class TestCanonicalJsonParity:
             result = dumps_canonical(test_input)
             assert result == expected, f"Mismatch for {test_input}: got {result}, expected {expected}"
 
-    def test_canonical_json_fixtures(self):
+    @pytest.mark.parametrize("test_case", _CANONICAL_CASES, ids=lambda case: case["name"])
+    def test_canonical_json_fixtures(self, test_case):
         """Test against canonical JSON golden fixtures."""
-        if not self.canonical_json_fixtures.get("testCases"):
-            pytest.skip("No canonical JSON fixtures found")
-
-        for test_case in self.canonical_json_fixtures["testCases"]:
-            name = test_case["name"]
-            input_obj = test_case["input"]
-            expected = test_case["expectedCanonical"]
+        name = test_case["name"]
+        input_obj = test_case["input"]
+        expected = test_case["expectedCanonical"]
 
-            result = dumps_canonical(input_obj)
-            assert result == expected, f"Test case {name} failed: got {result}, expected {expected}"
+        result = dumps_canonical(input_obj)
+        assert result == expected, f"Test case {name} failed: got {result}, expected {expected}"
 
     def test_transaction_signing_vectors(self):
         """Test canonical JSON against transaction signing vectors."""
@@ -109,7 +96,7 @@ class TestCanonicalJsonParity:
             name = vector["name"]
             transaction = vector["transaction"]
             expected_canonical = vector["canonicalJSON"]
-            expected_hash = vector["txHash"]
+            expected_hash = bytes.fromhex(vector["txHash"])
 
             # Test canonical JSON
             result_canonical = dumps_canonical(transaction)
@@ -118,9 +105,9 @@ class TestCanonicalJsonParity:
 
             # Test hash computation
             canonical_bytes = canonicalize_for_hashing(transaction)
-            computed_hash = hashlib.sha256(canonical_bytes).hexdigest()
+            computed_hash = hashlib.sha256(canonical_bytes).digest()
             assert computed_hash == expected_hash, \
-                f"Hash mismatch for {name}: got {computed_hash}, expected {expected_hash}"
+                f"Hash mismatch for {name}: got {computed_hash.hex()}, expected {expected_hash.hex()}"
 
     def test_envelope_fixtures(self):
         """Test canonical JSON with envelope fixtures."""
@@ -137,28 +124,25 @@ class TestCanonicalJsonParity:
             recanonical = dumps_canonical(reparsed)
             assert canonical == recanonical, "Canonical JSON should be stable under round-trip"
 
-    def test_ts_parity_fixtures(self):
+    @pytest.mark.parametrize("fixture", _TS_PARITY_FIXTURES)
+    def test_ts_parity_fixtures(self, fixture):
         """Test against TypeScript SDK parity fixtures if available."""
-        if not self.ts_parity_fixtures.get("fixtures"):
-            pytest.skip("No TypeScript parity fixtures found")
-
-        for fixture in self.ts_parity_fixtures["fixtures"]:
-            if "canonical_json_string" in fixture:
-                py_obj = fixture.get("object") or fixture.get("input")
-                expected_canonical = fixture["canonical_json_string"]
-
-                if py_obj is not None:
-                    result = dumps_canonical(py_obj)
-                    assert result == expected_canonical, \
-                        f"TS parity mismatch: got {result}, expected {expected_canonical}"
-
-                    # Test hash if provided
-                    if "hash" in fixture:
-                        canonical_bytes = canonicalize_for_hashing(py_obj)
-                        computed_hash = hashlib.sha256(canonical_bytes).hexdigest()
-                        expected_hash = fixture["hash"]
-                        assert computed_hash == expected_hash, \
-                            f"Hash mismatch: got {computed_hash}, expected {expected_hash}"
+        if "canonical_json_string" in fixture:
+            py_obj = fixture.get("object") or fixture.get("input")
+            expected_canonical = fixture["canonical_json_string"]
+
+            if py_obj is not None:
+                result = dumps_canonical(py_obj)
+                assert result == expected_canonical, \
+                    f"TS parity mismatch: got {result}, expected {expected_canonical}"
+
+                # Test hash if provided
+                if "hash" in fixture:
+                    canonical_bytes = canonicalize_for_hashing(py_obj)
+                    computed_hash = hashlib.sha256(canonical_bytes).digest()
+                    expected_hash = bytes.fromhex(fixture["hash"])
+                    assert computed_hash == expected_hash, \
+                        f"Hash mismatch: got {computed_hash.hex()}, expected {expected_hash.hex()}"
 
     def test_key_sorting_unicode(self):
         """Test that key sorting handles Unicode correctly."""
@@ -289,14 +273,12 @@ class TestCanonicalJsonParity:
             "m": "middle"
         }
 
-        # Multiple rounds of canonicalization should be stable
+        # Canonicalization is a fixed point: once a parse/serialize round
+        # reproduces the same text, every later round does too
         canonical1 = dumps_canonical(complex_obj)
-        parsed = json.loads(canonical1)
-        canonical2 = dumps_canonical(parsed)
-        parsed2 = json.loads(canonical2)
-        canonical3 = dumps_canonical(parsed2)
+        canonical2 = dumps_canonical(json.loads(canonical1))
 
-        assert canonical1 == canonical2 == canonical3
+        assert canonical1 == canonical2
 
     def test_compare_with_dart_output_utility(self):
         """Test the utility function for comparing with Dart output."""
@@ -328,14 +310,14 @@ def test_standalone_example():
     }
 
     expected_canonical = '{"body":{"to":[{"amount":"1000","url":"acc://bob.acme/tokens"}],"type":"send-tokens"},"header":{"principal":"acc://alice.acme/tokens","timestamp":1234567890123}}'
-    expected_hash = "4be49c59c717f1984646998cecac0e5225378d9bbe2e18928272a85b7dfcb608"
+    expected_hash = bytes.fromhex("4be49c59c717f1984646998cecac0e5225378d9bbe2e18928272a85b7dfcb608")
 
     result_canonical = dumps_canonical(test_input)
     assert result_canonical == expected_canonical
 
     # Test hash
     canonical_bytes = canonicalize_for_hashing(test_input)
-    computed_hash = hashlib.sha256(canonical_bytes).hexdigest()
+    computed_hash = hashlib.sha256(canonical_bytes).digest()
     assert computed_hash == expected_hash
 
 
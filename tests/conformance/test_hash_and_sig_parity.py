@@ -5,26 +5,70 @@ This module validates that our Python implementation produces exactly the same
 hashes and signatures as the TypeScript SDK for all test vectors.
 """
 
-import json
-import os
+import functools
 import hashlib
+from collections import namedtuple
+from pathlib import Path
 from typing import Dict, Any
 
 import pytest
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is optional
+    import json as _json
+
 from src.accumulate_client.canonjson import dumps_canonical
 from src.accumulate_client.crypto.ed25519 import Ed25519KeyPair, Ed25519Signature
 from src.accumulate_client.protocol.hashing import (
-    hash_transaction, hash_transaction_hex, verify_transaction_hash,
+    hash_transaction, verify_transaction_hash,
     hash_for_ed25519_signing, create_signature_metadata_hash
 )
 
+_GOLDEN_DIR = Path(__file__).resolve().parent.parent / 'golden' / 'enums'
+
 
+@functools.lru_cache(maxsize=None)
 def load_golden_fixture(filename: str) -> Dict[str, Any]:
-    """Load a golden fixture JSON file."""
-    fixture_path = os.path.join(os.path.dirname(__file__), '..', 'golden', filename)
-    with open(fixture_path, 'r') as f:
-        return json.load(f)
+    """Load a golden fixture JSON file (parsed once per process; treat as read-only)."""
+    return _json.loads((_GOLDEN_DIR / filename).read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def load_signing_vector_columns() -> Dict[str, list]:
+    """Signing vectors as parallel columns, with key material decoded to bytes once."""
+    vectors = load_golden_fixture('tx_signing_vectors.json')['vectors']
+    return {
+        'name': [v['name'] for v in vectors],
+        'private_key': [bytes.fromhex(v['privateKey']) for v in vectors],
+        'public_key': [bytes.fromhex(v['publicKey']) for v in vectors],
+        'transaction': [v['transaction'] for v in vectors],
+        'canonical': [v['canonicalJSON'] for v in vectors],
+        'tx_hash': [v['txHash'] for v in vectors],
+        'tx_hash_bytes': [bytes.fromhex(v['txHash']) for v in vectors],
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def keypair_from_seed(seed: bytes) -> Ed25519KeyPair:
+    """Derive a keypair once per seed; keypairs are immutable, so sharing is safe."""
+    return Ed25519KeyPair.from_seed(seed)
+
+
+def pytest_generate_tests(metafunc):
+    """Give each signing vector its own test item, reading the vectors at collection rather than import."""
+    if 'vector_index' in metafunc.fixturenames:
+        try:
+            names = load_signing_vector_columns()['name']
+        except (OSError, ValueError, KeyError):
+            # A single item whose signing_columns fixture reports the load error
+            names = ['unloadable']
+        metafunc.parametrize('vector_index', range(len(names)), ids=names)
+
+
+@pytest.fixture(scope="module")
+def signing_columns() -> Dict[str, list]:
+    return load_signing_vector_columns()
 
 
 class TestEd25519SignatureParity:
@@ -37,13 +81,13 @@ class TestEd25519SignatureParity:
         public_key = golden['publicKey']
         signature = golden['signature']
         message = golden['message']
-        expected_message_hash = golden['messageHash']
+        expected_message_hash = bytes.fromhex(golden['messageHash'])
 
         # Verify message hash
         message_bytes = message.encode('utf-8')
-        computed_hash = hashlib.sha256(message_bytes).digest().hex()
+        computed_hash = hashlib.sha256(message_bytes).digest()
         assert computed_hash == expected_message_hash, \
-            f"Message hash mismatch: {computed_hash} != {expected_message_hash}"
+            f"Message hash mismatch: {computed_hash.hex()} != {expected_message_hash.hex()}"
 
         # Verify signature
         is_valid = Ed25519Signature.verify_signature(public_key, message, signature)
@@ -53,65 +97,60 @@ class TestEd25519SignatureParity:
 class TestTransactionHashParity:
     """Test transaction hashing against TypeScript SDK vectors."""
 
-    def test_tx_signing_vectors(self):
-        """Test all transaction signing vectors for hash parity."""
-        vectors = load_golden_fixture('tx_signing_vectors.json')
-
-        for vector in vectors['vectors']:
-            name = vector['name']
-            private_key = vector['privateKey']
-            expected_public_key = vector['publicKey']
-            transaction = vector['transaction']
-            expected_canonical = vector['canonicalJSON']
-            expected_tx_hash = vector['txHash']
-            expected_signature = vector['signature']
-
-            # Test key derivation
-            keypair = Ed25519KeyPair.from_seed(private_key)
-            actual_public_key = keypair.public_key_bytes().hex()
-            assert actual_public_key == expected_public_key, \
-                f"Public key mismatch for {name}: {actual_public_key} != {expected_public_key}"
-
-            # Test canonical JSON
-            actual_canonical = dumps_canonical(transaction)
-            assert actual_canonical == expected_canonical, \
-                f"Canonical JSON mismatch for {name}:\nActual:   {actual_canonical}\nExpected: {expected_canonical}"
-
-            # Test transaction hash
-            actual_tx_hash = hash_transaction_hex(transaction)
-            assert actual_tx_hash == expected_tx_hash, \
-                f"Transaction hash mismatch for {name}: {actual_tx_hash} != {expected_tx_hash}"
-
-            # Verify hash with verification function
-            hash_verified = verify_transaction_hash(transaction, expected_tx_hash)
-            assert hash_verified, f"Hash verification failed for {name}"
+    def test_tx_signing_vectors(self, signing_columns, vector_index):
+        """Test each transaction signing vector for hash parity."""
+        columns = signing_columns
+        i = vector_index
+        name = columns['name'][i]
+        expected_public_key = columns['public_key'][i]
+        transaction = columns['transaction'][i]
+        expected_canonical = columns['canonical'][i]
+        expected_tx_hash = columns['tx_hash'][i]
+        expected_tx_hash_bytes = columns['tx_hash_bytes'][i]
+
+        # Test key derivation
+        keypair = keypair_from_seed(columns['private_key'][i])
+        actual_public_key = keypair.public_key_bytes()
+        assert actual_public_key == expected_public_key, \
+            f"Public key mismatch for {name}: {actual_public_key.hex()} != {expected_public_key.hex()}"
+
+        # Test canonical JSON
+        actual_canonical = dumps_canonical(transaction)
+        assert actual_canonical == expected_canonical, \
+            f"Canonical JSON mismatch for {name}:\nActual:   {actual_canonical}\nExpected: {expected_canonical}"
+
+        # Test transaction hash
+        actual_tx_hash = hash_transaction(transaction)
+        assert actual_tx_hash == expected_tx_hash_bytes, \
+            f"Transaction hash mismatch for {name}: {actual_tx_hash.hex()} != {expected_tx_hash}"
+
+        # Verify hash with verification function
+        hash_verified = verify_transaction_hash(transaction, expected_tx_hash)
+        assert hash_verified, f"Hash verification failed for {name}"
 
 
 class TestSigningIntegration:
     """Test complete signing workflow integration."""
 
-    def test_complete_signing_workflow(self):
+    def test_complete_signing_workflow(self, signing_columns):
         """Test the complete workflow: key derivation → hash → sign → verify."""
-        # Use first vector for comprehensive test
-        vectors = load_golden_fixture('tx_signing_vectors.json')
-        vector = vectors['vectors'][0]  # simple_send_tokens
-
-        private_key = vector['privateKey']
-        transaction = vector['transaction']
-        expected_tx_hash = vector['txHash']
+        # Use first vector for comprehensive test (simple_send_tokens)
+        private_key = signing_columns['private_key'][0]
+        transaction = signing_columns['transaction'][0]
+        expected_tx_hash = signing_columns['tx_hash_bytes'][0]
 
         # 1. Key derivation
-        keypair = Ed25519KeyPair.from_seed(private_key)
+        keypair = keypair_from_seed(private_key)
+        pub_hex = keypair.public_key_bytes().hex()
 
         # 2. Transaction hashing
         tx_hash = hash_transaction(transaction)
-        tx_hash_hex = tx_hash.hex()
-        assert tx_hash_hex == expected_tx_hash
+        assert tx_hash == expected_tx_hash
 
         # 3. Create signature metadata (simple case)
         signature_metadata = {
             "type": "ed25519",
-            "publicKey": keypair.public_key_bytes().hex(),
+            "publicKey": pub_hex,
             "signer": "acc://alice.acme/book/1"
         }
 
@@ -126,9 +165,8 @@ class TestSigningIntegration:
         assert is_valid, "Signature verification failed in complete workflow"
 
         # 7. Verify with static method
-        public_key_hex = keypair.public_key_bytes().hex()
         is_valid_static = Ed25519Signature.verify_signature(
-            public_key_hex, signing_hash, signature
+            pub_hex, signing_hash, signature
         )
         assert is_valid_static, "Static signature verification failed"
 
@@ -170,12 +208,28 @@ class TestHashFunctionVariants:
         assert signing_hash == signing_hash2, "Ed25519 signing hash is not deterministic"
 
 
+EnvelopeContext = namedtuple('EnvelopeContext', ['envelope', 'tx_hash_bytes', 'public_key', 'signature'])
+
+
+@pytest.fixture(scope="module")
+def envelope_ctx() -> EnvelopeContext:
+    """Golden envelope with its signature fields decoded once for the module."""
+    envelope = load_golden_fixture('envelope_fixed.golden.json')
+    signature_data = envelope['signatures'][0]
+    return EnvelopeContext(
+        envelope=envelope,
+        tx_hash_bytes=bytes.fromhex(signature_data['transactionHash']),
+        public_key=bytes.fromhex(signature_data['publicKey']),
+        signature=bytes.fromhex(signature_data['signature']),
+    )
+
+
 class TestEnvelopeStructure:
     """Test envelope structure hash verification."""
 
-    def test_envelope_transaction_hash(self):
+    def test_envelope_transaction_hash(self, envelope_ctx):
         """Test envelope structure with transaction hash verification."""
-        envelope = load_golden_fixture('envelope_fixed.golden.json')
+        envelope = envelope_ctx.envelope
 
         # Extract transaction and signature data
         signatures = envelope['signatures']
@@ -193,28 +247,21 @@ class TestEnvelopeStructure:
         assert 'signature' in signature_data
         assert 'transactionHash' in signature_data
 
-        expected_tx_hash = signature_data['transactionHash']
-
         # Compute transaction hash and verify it matches envelope
-        computed_hash = hash_transaction_hex(transaction)
-        assert computed_hash == expected_tx_hash, \
-            f"Envelope transaction hash mismatch: {computed_hash} != {expected_tx_hash}"
+        tx_hash_bytes = envelope_ctx.tx_hash_bytes
+        computed_hash = hash_transaction(transaction)
+        assert computed_hash == tx_hash_bytes, \
+            f"Envelope transaction hash mismatch: {computed_hash.hex()} != {tx_hash_bytes.hex()}"
 
         # Verify signature against transaction hash
-        public_key = signature_data['publicKey']
-        signature = signature_data['signature']
-
-        # For envelope verification, we need to hash the transaction hash bytes
-        tx_hash_bytes = bytes.fromhex(expected_tx_hash)
-
-        # Verify the signature
-        is_valid = Ed25519Signature.verify_signature(public_key, tx_hash_bytes, signature)
+        is_valid = Ed25519Signature.verify_signature(
+            signature_data['publicKey'], tx_hash_bytes, signature_data['signature']
+        )
         assert is_valid, "Envelope signature verification failed"
 
-    def test_envelope_signature_metadata(self):
+    def test_envelope_signature_metadata(self, envelope_ctx):
         """Test envelope signature metadata structure."""
-        envelope = load_golden_fixture('envelope_fixed.golden.json')
-        signature_data = envelope['signatures'][0]
+        signature_data = envelope_ctx.envelope['signatures'][0]
 
         # Verify all required fields are present
         required_fields = ['type', 'publicKey', 'signature', 'signer', 'signerVersion', 'timestamp', 'transactionHash']
@@ -223,12 +270,12 @@ class TestEnvelopeStructure:
 
         # Verify field types and formats
         assert signature_data['type'] == 'ed25519'
-        assert len(signature_data['publicKey']) == 64  # 32 bytes as hex
-        assert len(signature_data['signature']) == 128  # 64 bytes as hex
+        assert len(envelope_ctx.public_key) == 32
+        assert len(envelope_ctx.signature) == 64
         assert signature_data['signer'].startswith('acc://')
         assert isinstance(signature_data['signerVersion'], int)
         assert isinstance(signature_data['timestamp'], int)
-        assert len(signature_data['transactionHash']) == 64  # 32 bytes as hex
+        assert len(envelope_ctx.tx_hash_bytes) == 32
 
 
 if __name__ == '__main__':
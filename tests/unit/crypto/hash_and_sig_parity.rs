@@ -1,4 +1,4 @@
-use accumulate_client::{Ed25519Signer, verify, verify_signature, sha256_bytes, canonical_json};
+use accumulate_client::{Ed25519Signer, verify, verify_batch, verify_signature, sha256_bytes, canonical_json};
 use serde_json::{json, Value};
 use std::fs;
 use std::path::Path;
@@ -203,6 +203,46 @@ fn test_transaction_signing_vectors_parity() {
     }
 }
 
+#[test]
+fn test_transaction_signing_vectors_batch_verify() {
+    let vectors = load_tx_signing_vectors().expect("Failed to parse signing vectors");
+
+    let mut public_keys: Vec<[u8; 32]> = Vec::new();
+    let mut messages: Vec<String> = Vec::new();
+    let mut signatures: Vec<[u8; 64]> = Vec::new();
+    for vector in vectors["vectors"].as_array().unwrap() {
+        let private_key: [u8; 32] = hex_to_bytes(vector["privateKey"].as_str().unwrap());
+        let canonical = vector["canonicalJSON"].as_str().unwrap();
+        let signer =
+            Ed25519Signer::from_seed(&private_key).expect("Failed to create signer from seed");
+
+        // A fresh signature over the canonical JSON, which must verify
+        public_keys.push(signer.public_key_bytes());
+        messages.push(canonical.to_string());
+        signatures.push(signer.sign(canonical.as_bytes()));
+
+        // The golden signature, which is only a placeholder in these vectors
+        public_keys.push(hex_to_bytes(vector["publicKey"].as_str().unwrap()));
+        messages.push(canonical.to_string());
+        signatures.push(hex_to_bytes(vector["signature"].as_str().unwrap()));
+    }
+
+    // One batch call reports exactly what verifying each entry on its own does
+    let messages: Vec<&[u8]> = messages.iter().map(|m| m.as_bytes()).collect();
+    let expected: Vec<bool> = public_keys
+        .iter()
+        .zip(&messages)
+        .zip(&signatures)
+        .map(|((public_key, message), signature)| verify(public_key, message, signature))
+        .collect();
+    let results = verify_batch(&public_keys, &messages, &signatures);
+    assert_eq!(results, expected);
+    assert!(
+        results.iter().step_by(2).all(|ok| *ok),
+        "Fresh signatures must verify"
+    );
+}
+
 #[test]
 fn test_hash_transaction_centralized() {
     // Test that our hashing function works correctly
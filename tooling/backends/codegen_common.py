@@ -0,0 +1,120 @@
+"""
+Helpers shared by the Rust code generators in this directory.
+
+Each generator is still run as a standalone script; this module sits next to
+them so `import codegen_common` resolves from the script's own directory.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Matches the generation timestamp on a header or manifest line, so a rerun that
+# changes nothing else leaves outputs untouched
+TIMESTAMP_RE = re.compile(
+    r'^(.*?(?:Generated: |"generated_at": "))\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?',
+    re.MULTILINE)
+
+def _cache_path(file_path: str) -> str:
+    """Pickle cache location for a parsed input; CODEGEN_CACHE_DIR overrides the default of next to the source."""
+    cache_dir = os.environ.get("CODEGEN_CACHE_DIR")
+    if cache_dir:
+        return os.path.join(cache_dir, os.path.basename(file_path) + ".pickle")
+    return str(file_path) + ".pickle"
+
+def load_cached(file_path, parse: Callable[[str], Any]) -> Any:
+    """Return parse(file_path), reusing a pickle of the result while the file's mtime and size are unchanged.
+
+    Results are also memoized in-process; callers must treat them as read-only.
+    """
+    resolved = os.path.realpath(file_path)
+    st = os.stat(resolved)
+    return _load_keyed(resolved, st.st_mtime_ns, st.st_size, parse)
+
+@functools.lru_cache(maxsize=16)
+def _load_keyed(resolved: str, mtime_ns: int, size: int, parse: Callable[[str], Any]) -> Any:
+    key = (resolved, mtime_ns, size)
+    cache_file = _cache_path(resolved)
+
+    try:
+        with open(cache_file, 'rb') as f:
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    data = parse(resolved)
+    if data:
+        # Write to a temporary file and swap it in, so a concurrent or interrupted
+        # run never leaves a torn cache behind
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    return data
+
+def write_if_changed(file_path, content: str) -> bool:
+    """Write content unless the file already holds it, ignoring the generation timestamp. Returns True if written."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            existing = f.read()
+    except OSError:
+        existing = None
+
+    if existing is not None and TIMESTAMP_RE.sub(r'\1', existing) == TIMESTAMP_RE.sub(r'\1', content):
+        return False
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+def dumps_json(obj) -> str:
+    """Serialize obj as json.dumps(obj, indent=2) does, taking the orjson fast path when it yields the same text.
+
+    orjson writes non-ASCII as raw UTF-8 rather than \\u escapes and rejects ints
+    wider than 64 bits, so those cases go through the stdlib. Floats are the one
+    remaining difference (orjson spells 1e+16 as 1e16); the generated manifests
+    and vectors contain none.
+    """
+    if orjson is not None:
+        try:
+            text = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass
+        else:
+            if text.isascii():
+                return text
+    return json.dumps(obj, indent=2)
+
+def compute_stamp(*paths) -> str:
+    """SHA-256 over the bytes of every input, so editing any of them invalidates the stamp."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+def is_up_to_date(stamp_file, stamp: str, *outputs) -> bool:
+    """True if stamp_file records stamp and every output still exists."""
+    try:
+        recorded = Path(stamp_file).read_text().strip()
+    except OSError:
+        return False
+    return recorded == stamp and all(Path(p).exists() for p in outputs)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Run the enum and API method generators concurrently.
+
+The two generators read disjoint Go YAML inputs and write disjoint outputs,
+so each runs in its own process. Exits with the first non-zero generator
+exit code, or 0 if both succeed.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import rust_enums_codegen
+import rust_methods_codegen
+
+GENERATORS = (rust_enums_codegen.main, rust_methods_codegen.main)
+
+def main():
+    with ProcessPoolExecutor(max_workers=len(GENERATORS)) as executor:
+        futures = [executor.submit(generator) for generator in GENERATORS]
+        exit_codes = [future.result() for future in futures]
+
+    return next((code for code in exit_codes if code), 0)
+
+if __name__ == "__main__":
+    sys.exit(main())
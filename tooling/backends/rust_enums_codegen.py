@@ -4,13 +4,22 @@ Rust Enums Code Generator for Accumulate Protocol
 Reads Go YAML truth and generates Rust enums with exact wire compatibility.
 """
 
+import functools
 import os
 import sys
 import yaml
-import json
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+from codegen_common import dumps_json, load_cached, write_if_changed
+
+# Prefer libyaml's C parser; fall back to the pure-Python loader without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Paths
 GO_REPO = r"C:\Accumulate_Stuff\accumulate"
 RUST_ROOT = r"C:\Accumulate_Stuff\opendlt-rust-v2v3-sdk\unified"
@@ -19,11 +28,40 @@ GEN_DIR = os.path.join(SRC_DIR, "generated")
 
 EXPECTED_ENUM_COUNT = 14
 
+EXPECTED_ENUMS = frozenset({
+    "ExecutorVersion", "PartitionType", "DataEntryType", "ObjectType",
+    "SignatureType", "KeyPageOperationType", "AccountAuthOperationType",
+    "NetworkMaintenanceOperationType", "TransactionMax", "TransactionType",
+    "AccountType", "AllowedTransactionBit", "VoteType", "BookType"
+})
+
+# Variant names kept verbatim rather than PascalCased
+VARIANT_NAME_MAP = {
+    "V1SignatureAnchoring": "V1SignatureAnchoring",
+    "V1DoubleHashEntries": "V1DoubleHashEntries",
+    "V1Halt": "V1Halt",
+    "V2Baikonur": "V2Baikonur",
+    "V2Vandenberg": "V2Vandenberg",
+    "V2Jiuquan": "V2Jiuquan",
+}
+
+# Rust source templates, filled with str.format
+ENUM_TEMPLATE = """#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
+pub enum {enum_name} {{
+{variants}
+}}"""
+
+ENUM_VARIANT_TEMPLATE = """    #[serde(rename = "{wire_tag}")]
+    {variant},"""
+
+def _parse_yaml(file_path):
+    with open(file_path, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 def load_yaml_with_anchors(file_path):
     """Load YAML file with anchor resolution."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return load_cached(file_path, _parse_yaml)
     except Exception as e:
         print(f"Error loading {file_path}: {e}")
         return {}
@@ -49,62 +87,55 @@ def extract_wire_tag(variant_data):
 def normalize_variant_name(name):
     """Normalize variant names to valid Rust identifiers."""
     # Handle special cases
-    name_map = {
-        "V1SignatureAnchoring": "V1SignatureAnchoring",
-        "V1DoubleHashEntries": "V1DoubleHashEntries",
-        "V1Halt": "V1Halt",
-        "V2Baikonur": "V2Baikonur",
-        "V2Vandenberg": "V2Vandenberg",
-        "V2Jiuquan": "V2Jiuquan",
-    }
-
-    if name in name_map:
-        return name_map[name]
+    if name in VARIANT_NAME_MAP:
+        return VARIANT_NAME_MAP[name]
 
     return pascal_case(name) if '_' in name else name
 
+@functools.lru_cache(maxsize=None)
+def default_wire_tag(enum_name, variant_name):
+    """Wire tag for a variant without an explicit label or alias."""
+    if enum_name == "TransactionType":
+        # Transaction types use camelCase
+        return variant_name[0].lower() + variant_name[1:] if len(variant_name) > 1 else variant_name.lower()
+    # Most other enums use the variant name directly or lowercase
+    return variant_name.lower()
+
 def generate_enum_rust_code(enum_name, variants_data):
     """Generate Rust enum code for a single enum."""
     variants = []
+    rust_variants = []
+    wire_tags = []
 
     # Sort variants by value to maintain stable order
-    sorted_variants = sorted(variants_data.items(),
-                           key=lambda x: x[1].get('value', 0) if isinstance(x[1], dict) else 0)
+    sorted_variants = [(variant_data.get('value', 0) if isinstance(variant_data, dict) else 0, variant_name, variant_data)
+                       for variant_name, variant_data in variants_data.items()]
+    sorted_variants.sort(key=itemgetter(0))
 
-    for variant_name, variant_data in sorted_variants:
+    for _, variant_name, variant_data in sorted_variants:
         rust_variant = normalize_variant_name(variant_name)
         wire_tag = extract_wire_tag(variant_data)
 
-        if wire_tag:
-            # Use explicit wire tag
-            variants.append(f'    #[serde(rename = "{wire_tag}")]\n    {rust_variant},')
-        else:
+        if not wire_tag:
             # Use variant name as wire tag (convert to appropriate case)
-            if enum_name == "TransactionType":
-                # Transaction types use camelCase
-                wire_tag = variant_name[0].lower() + variant_name[1:] if len(variant_name) > 1 else variant_name.lower()
-                variants.append(f'    #[serde(rename = "{wire_tag}")]\n    {rust_variant},')
-            else:
-                # Most other enums use the variant name directly or lowercase
-                wire_tag = variant_name.lower()
-                variants.append(f'    #[serde(rename = "{wire_tag}")]\n    {rust_variant},')
-
-    # Generate the enum
-    enum_code = f'''#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
-pub enum {enum_name} {{
-{chr(10).join(variants)}
-}}'''
+            wire_tag = default_wire_tag(enum_name, variant_name)
+
+        variants.append(ENUM_VARIANT_TEMPLATE.format(wire_tag=wire_tag, variant=rust_variant))
+        rust_variants.append(rust_variant)
+        wire_tags.append(wire_tag)
+
+    enum_code = ENUM_TEMPLATE.format(enum_name=enum_name, variants='\n'.join(variants))
 
-    return enum_code, [v.split(',')[0].strip().split()[-1] for v in variants]
+    return enum_code, rust_variants, wire_tags
 
 def generate_test_helper(all_enums_data):
     """Generate test helper functions for roundtrip testing."""
-    helper_code = '''
+    parts = ['''
 pub fn __roundtrip_one(enum_name: &str, tag: &str) -> Result<(), Box<dyn std::error::Error>> {
-    match enum_name {'''
+    match enum_name {''']
 
     for enum_name, variants in all_enums_data.items():
-        helper_code += f'''
+        parts.append(f'''
         "{enum_name}" => {{
             let v = serde_json::Value::String(tag.to_string());
             let val: {enum_name} = serde_json::from_value(v.clone())?;
@@ -113,27 +144,27 @@ pub fn __roundtrip_one(enum_name: &str, tag: &str) -> Result<(), Box<dyn std::er
                 return Err(format!("Roundtrip failed for {{}}::{{}}: expected {{}}, got {{}}",
                     enum_name, tag, v, back).into());
             }}
-        }}'''
+        }}''')
 
-    helper_code += '''
+    parts.append('''
         _ => return Err(format!("Unknown enum: {}", enum_name).into()),
     }
     Ok(())
 }
 
 pub fn __get_all_enum_variants() -> std::collections::HashMap<String, Vec<String>> {
-    let mut map = std::collections::HashMap::new();'''
+    let mut map = std::collections::HashMap::new();''')
 
     for enum_name, variants in all_enums_data.items():
         variant_list = ', '.join(f'"{v}".to_string()' for v in variants)
-        helper_code += f'''
-    map.insert("{enum_name}".to_string(), vec![{variant_list}]);'''
+        parts.append(f'''
+    map.insert("{enum_name}".to_string(), vec![{variant_list}]);''')
 
-    helper_code += '''
+    parts.append('''
     map
-}'''
+}''')
 
-    return helper_code
+    return ''.join(parts)
 
 def main():
     print("=== Rust Enums Code Generator ===")
@@ -158,16 +189,10 @@ def main():
     if enum_count != EXPECTED_ENUM_COUNT:
         print(f"ENUM_COUNT_FAIL: found {enum_count}, expected {EXPECTED_ENUM_COUNT}")
 
-        expected_enums = {
-            "ExecutorVersion", "PartitionType", "DataEntryType", "ObjectType",
-            "SignatureType", "KeyPageOperationType", "AccountAuthOperationType",
-            "NetworkMaintenanceOperationType", "TransactionMax", "TransactionType",
-            "AccountType", "AllowedTransactionBit", "VoteType", "BookType"
-        }
-        found_enums = set(enums_data.keys())
+        found_enums = enums_data.keys()
 
-        missing = expected_enums - found_enums
-        extra = found_enums - expected_enums
+        missing = EXPECTED_ENUMS.difference(found_enums)
+        extra = found_enums - EXPECTED_ENUMS
 
         if missing:
             print(f"Missing: {sorted(missing)}")
@@ -179,12 +204,12 @@ def main():
     # Generate Rust code
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    rust_code = f'''// GENERATED FILE - DO NOT EDIT
+    rust_parts = [f'''// GENERATED FILE - DO NOT EDIT
 // Source: protocol/enums.yml | Generated: {timestamp}
 
 use serde::{{Serialize, Deserialize}};
 
-'''
+''']
 
     all_enums_data = {}
     enum_manifest = {
@@ -198,22 +223,9 @@ use serde::{{Serialize, Deserialize}};
         enum_data = enums_data[enum_name]
         print(f"Generating enum: {enum_name}")
 
-        enum_code, variant_names = generate_enum_rust_code(enum_name, enum_data)
-        rust_code += enum_code + "\n\n"
-
-        # Collect wire tags for manifest
-        wire_tags = []
-        sorted_variants = sorted(enum_data.items(),
-                               key=lambda x: x[1].get('value', 0) if isinstance(x[1], dict) else 0)
-
-        for variant_name, variant_data in sorted_variants:
-            wire_tag = extract_wire_tag(variant_data)
-            if not wire_tag:
-                if enum_name == "TransactionType":
-                    wire_tag = variant_name[0].lower() + variant_name[1:] if len(variant_name) > 1 else variant_name.lower()
-                else:
-                    wire_tag = variant_name.lower()
-            wire_tags.append(wire_tag)
+        enum_code, variant_names, wire_tags = generate_enum_rust_code(enum_name, enum_data)
+        rust_parts.append(enum_code)
+        rust_parts.append("\n\n")
 
         all_enums_data[enum_name] = wire_tags
         enum_manifest["enums"].append({
@@ -222,24 +234,25 @@ use serde::{{Serialize, Deserialize}};
         })
 
     # Add test helpers
-    rust_code += generate_test_helper(all_enums_data)
+    rust_parts.append(generate_test_helper(all_enums_data))
+    rust_code = ''.join(rust_parts)
 
     # Ensure output directory exists
     os.makedirs(GEN_DIR, exist_ok=True)
 
     # Write Rust file
     rust_file = os.path.join(GEN_DIR, "enums.rs")
-    with open(rust_file, 'w', encoding='utf-8') as f:
-        f.write(rust_code)
-
-    print(f"Generated: {rust_file}")
+    if write_if_changed(rust_file, rust_code):
+        print(f"Generated: {rust_file}")
+    else:
+        print(f"Unchanged: {rust_file}")
 
     # Write manifest
     manifest_file = os.path.join(GEN_DIR, "enums_manifest.json")
-    with open(manifest_file, 'w', encoding='utf-8') as f:
-        json.dump(enum_manifest, f, indent=2)
-
-    print(f"Generated: {manifest_file}")
+    if write_if_changed(manifest_file, dumps_json(enum_manifest)):
+        print(f"Generated: {manifest_file}")
+    else:
+        print(f"Unchanged: {manifest_file}")
 
     print(f"SUCCESS: Generated {enum_count} enums with exact wire compatibility")
     return 0
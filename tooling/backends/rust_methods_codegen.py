@@ -13,14 +13,23 @@ Requirements:
 - Create manifest JSON with metadata
 """
 
+import functools
 import yaml
-import json
 import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
+from codegen_common import dumps_json, load_cached, write_if_changed
+
+# Prefer libyaml's C parser; fall back to the pure-Python loader without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Constants
 GO_REPO = Path(r"C:\Accumulate_Stuff\accumulate")
 GO_METHODS = GO_REPO / "internal" / "api" / "v2" / "methods.yml"
@@ -28,9 +37,140 @@ RUST_ROOT = Path(r"C:\Accumulate_Stuff\opendlt-rust-v2v3-sdk\unified")
 SRC_DIR = RUST_ROOT / "src"
 GEN_DIR = SRC_DIR / "generated"
 
+# methods.yml fields read by ApiMethod; everything else is skipped while parsing
+METHOD_FIELDS = frozenset({'rpc', 'description', 'input', 'output', 'call-params'})
+
+CAMEL_TO_SNAKE = re.compile(r'([a-z0-9])([A-Z])')
+
+# Rust source templates, filled with str.format
+STRUCT_TEMPLATE = """#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
+#[serde(rename_all = "camelCase")]
+pub struct {struct_name} {{
+{fields}
+}}"""
+
+QUERY_PARAMS_FIELDS = """    pub url: String,
+    #[serde(skip_serializing_if = "Option::is_none", default)]
+    pub options: Option<serde_json::Value>,"""
+
+FLATTENED_PARAMS_FIELDS = """    #[serde(flatten)]
+    pub params: serde_json::Value,"""
+
+FLATTENED_DATA_FIELDS = """    #[serde(flatten)]
+    pub data: serde_json::Value,"""
+
+STATUS_RESPONSE_FIELDS = """    pub ok: bool,
+    #[serde(skip_serializing_if = "Option::is_none", default)]
+    pub last_block_time: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none", default)]
+    pub version: Option<String>,"""
+
+TX_RESPONSE_FIELDS = """    pub transaction_hash: String,
+    #[serde(skip_serializing_if = "Option::is_none", default)]
+    pub simple_hash: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none", default)]
+    pub code: Option<u32>,
+    #[serde(skip_serializing_if = "Option::is_none", default)]
+    pub message: Option<String>,"""
+
+# Struct bodies keyed by classify_params / classify_result
+PARAMS_FIELDS = {
+    'empty': "    // No parameters",
+    # Faucet takes the transaction body's URL
+    'faucet': "    pub url: String,",
+    # Query types typically have URL and options
+    'query': QUERY_PARAMS_FIELDS,
+    # Detailed field schemas are not parsed yet
+    'generic': FLATTENED_PARAMS_FIELDS,
+}
+
+RESULT_FIELDS = {
+    'empty': "    // No result data",
+    'StatusResponse': STATUS_RESPONSE_FIELDS,
+    'TxResponse': TX_RESPONSE_FIELDS,
+    'generic': FLATTENED_DATA_FIELDS,
+}
+
+CLIENT_METHOD_TEMPLATE = """    pub async fn {method_name}(&self, params: {params_type}) -> Result<{result_type}, Error> {{
+        self.transport.rpc_call("{rpc_name}", &params).await
+    }}"""
+
+CLIENT_IMPL_TEMPLATE = """impl<C: AccumulateRpc + Send + Sync> AccumulateClient<C> {{
+{methods}
+}}"""
+
+# Minimal JSON literals for __minimal_pair_for_test, keyed like PARAMS_FIELDS / RESULT_FIELDS
+MINIMAL_PARAMS_JSON = {
+    'empty': 'json!({})',
+    'faucet': 'json!({"url": "acc://test.acme"})',
+    'query': 'json!({"url": "acc://test.acme"})',
+    'generic': 'json!({})',
+}
+
+MINIMAL_RESULT_JSON = {
+    'empty': 'json!({"data": {}})',
+    'StatusResponse': 'json!({"ok": true})',
+    'TxResponse': 'json!({"transactionHash": "deadbeef"})',
+    'generic': 'json!({"data": {}})',
+}
+
+TEST_HELPER_LINE = '        "{method}" => Some(({params}, {result})),'
+
+TEST_HELPERS_TEMPLATE = """#[cfg(test)]
+pub fn __minimal_pair_for_test(method_name: &str) -> Option<(serde_json::Value, serde_json::Value)> {{
+    use serde_json::json;
+    match method_name {{
+{helpers}
+        _ => None,
+    }}
+}}"""
+
+API_METHODS_TEMPLATE = """//! GENERATED FILE - DO NOT EDIT
+//! Source: internal/api/v2/methods.yml
+//! Generated: {timestamp}
+
+use serde::{{Serialize, Deserialize}};
+use crate::errors::Error;
+use crate::generated::header::TransactionHeader;
+use crate::generated::transactions::TransactionBody;
+use async_trait::async_trait;
+
+// AccumulateRpc trait for transport abstraction
+#[async_trait]
+pub trait AccumulateRpc {{
+    async fn rpc_call<TParams: Serialize + Send + Sync, TResult: for<'de> Deserialize<'de>>(
+        &self, method: &str, params: &TParams
+    ) -> Result<TResult, Error>;
+}}
+
+// Generic client wrapper
+pub struct AccumulateClient<C> {{
+    pub transport: C,
+}}
+
+impl<C> AccumulateClient<C> {{
+    pub fn new(transport: C) -> Self {{
+        Self {{ transport }}
+    }}
+}}
+
+// Parameter structures
+{params_code}
+
+// Result structures
+{results_code}
+
+// Client implementation with strongly-typed methods
+{client_code}
+
+{test_helpers}"""
+
 class ApiMethod:
     """Represents a parsed API method from YAML"""
 
+    __slots__ = ('name', 'rpc_name', 'description', 'input_type', 'output_type', 'call_params',
+                 'params_struct', 'result_struct', 'rust_method_name', 'params_json_lit', 'result_json_lit')
+
     def __init__(self, name: str, method_def: Dict[str, Any]):
         self.name = name
         self.rpc_name = method_def.get('rpc', name.lower())
@@ -39,47 +179,141 @@ class ApiMethod:
         self.output_type = method_def.get('output', None)
         self.call_params = method_def.get('call-params', [])
 
-    def get_params_struct_name(self) -> str:
-        """Generate Rust struct name for parameters"""
-        return f"{self.name}Params"
-
-    def get_result_struct_name(self) -> str:
-        """Generate Rust struct name for result"""
-        return f"{self.name}Response"
+        # Derived Rust names, used by every generator below
+        self.params_struct = f"{name}Params"
+        self.result_struct = f"{name}Response"
+        self.rust_method_name = CAMEL_TO_SNAKE.sub(r'\1_\2', name).lower()
 
-    def get_rust_method_name(self) -> str:
-        """Generate Rust method name (snake_case)"""
-        # Convert CamelCase to snake_case
-        import re
-        s1 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', self.name)
-        return s1.lower()
+        # Minimal JSON literals for the generated test helper
+        self.params_json_lit = MINIMAL_PARAMS_JSON[classify_params(self.input_type)]
+        self.result_json_lit = MINIMAL_RESULT_JSON[classify_result(self.output_type)]
 
     def get_method_info(self) -> Dict[str, Any]:
         """Get method information for manifest"""
         return {
             'name': self.rpc_name,
-            'params': self.get_params_struct_name(),
-            'result': self.get_result_struct_name(),
+            'params': self.params_struct,
+            'result': self.result_struct,
             'description': self.description
         }
 
-def load_yaml_file(file_path: Path) -> Dict[str, Any]:
-    """Load a YAML file and return its contents"""
+class _NeedFullLoad(Exception):
+    """Raised when methods.yml uses YAML features the event walk does not handle"""
+
+_STR_RESOLVER = yaml.resolver.Resolver()
+
+def _event_scalar(event: yaml.Event) -> str:
+    """Value of a scalar event that resolves to a plain string"""
+    if not isinstance(event, yaml.ScalarEvent) or event.tag not in (None, '!'):
+        raise _NeedFullLoad()
+    tag = _STR_RESOLVER.resolve(yaml.ScalarNode, event.value, event.implicit)
+    if tag != 'tag:yaml.org,2002:str':
+        raise _NeedFullLoad()
+    return event.value
+
+def _event_value(event, events) -> Any:
+    """Build the value starting at event from the rest of the event stream"""
+    if isinstance(event, yaml.ScalarEvent):
+        return _event_scalar(event)
+    if isinstance(event, yaml.SequenceStartEvent):
+        items = []
+        for item in events:
+            if isinstance(item, yaml.SequenceEndEvent):
+                return items
+            items.append(_event_value(item, events))
+    if isinstance(event, yaml.MappingStartEvent):
+        mapping = {}
+        for key in events:
+            if isinstance(key, yaml.MappingEndEvent):
+                return mapping
+            mapping[_event_scalar(key)] = _event_value(next(events), events)
+    raise _NeedFullLoad()
+
+def _skip_value(event, events) -> None:
+    """Consume the events of a value that is not needed"""
+    if isinstance(event, (yaml.SequenceStartEvent, yaml.MappingStartEvent)):
+        depth = 1
+        for inner in events:
+            if isinstance(inner, (yaml.SequenceStartEvent, yaml.MappingStartEvent)):
+                depth += 1
+            elif isinstance(inner, (yaml.SequenceEndEvent, yaml.MappingEndEvent)):
+                depth -= 1
+                if depth == 0:
+                    return
+
+def _expect_stream_end(events) -> None:
+    """Require the rest of the stream to be empty, so a second document gets yaml.load's ComposerError"""
+    for event in events:
+        if isinstance(event, yaml.StreamEndEvent):
+            return
+        if not isinstance(event, yaml.DocumentEndEvent):
+            raise _NeedFullLoad()
+
+def _walk_method_events(events) -> Dict[str, Any]:
+    """Collect METHOD_FIELDS of each top-level mapping without building the rest of the tree"""
+    events = iter(events)
+    for event in events:
+        if isinstance(event, yaml.MappingStartEvent):
+            break
+        if isinstance(event, (yaml.ScalarEvent, yaml.SequenceStartEvent, yaml.AliasEvent)):
+            raise _NeedFullLoad()
+    else:
+        return {}
+
+    methods = {}
+    for key in events:
+        if isinstance(key, yaml.MappingEndEvent):
+            _expect_stream_end(events)
+            return methods
+        name = _event_scalar(key)
+        value = next(events)
+        if not isinstance(value, yaml.MappingStartEvent):
+            if isinstance(value, yaml.AliasEvent):
+                raise _NeedFullLoad()
+            _skip_value(value, events)
+            methods[name] = None
+            continue
+
+        method_def = {}
+        for field in events:
+            if isinstance(field, yaml.MappingEndEvent):
+                break
+            field_name = _event_scalar(field)
+            if field_name == '<<':
+                raise _NeedFullLoad()
+            field_value = next(events)
+            if field_name in METHOD_FIELDS:
+                method_def[field_name] = _event_value(field_value, events)
+            else:
+                _skip_value(field_value, events)
+        methods[name] = method_def
+    return methods
+
+def _parse_method_defs(file_path: Path) -> Dict[str, Any]:
+    """Parse just the ApiMethod fields of methods.yml, falling back to a full load when needed"""
+    with open(file_path, 'rb') as f:
+        try:
+            return _walk_method_events(yaml.parse(f, Loader=SafeLoader))
+        except _NeedFullLoad:
+            f.seek(0)
+            return yaml.load(f, Loader=SafeLoader)
+
+def load_yaml_file(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a YAML file and return its contents, or None if it is missing or invalid"""
     if not file_path.exists():
         print(f"ERROR File not found: {file_path}")
-        sys.exit(1)
+        return None
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = yaml.safe_load(f)
-            print(f"OK Loaded {file_path}")
-            return content or {}
+        content = load_cached(file_path, _parse_method_defs)
+        print(f"OK Loaded {file_path}")
+        return content or {}
     except yaml.YAMLError as e:
         print(f"ERROR loading {file_path}: {e}")
-        sys.exit(1)
+        return None
 
-def extract_api_methods(yaml_data: Dict[str, Any]) -> List[ApiMethod]:
-    """Extract API methods from YAML data"""
+def extract_api_methods(yaml_data: Dict[str, Any]) -> Optional[List[ApiMethod]]:
+    """Extract API methods from YAML data, or None if the count gate fails"""
     methods = []
 
     for method_name, method_def in yaml_data.items():
@@ -98,7 +332,7 @@ def extract_api_methods(yaml_data: Dict[str, Any]) -> List[ApiMethod]:
             print(f"  Missing: {expected_count - actual_count} methods")
         else:
             print(f"  Extra: {actual_count - expected_count} methods")
-        sys.exit(2)
+        return None
 
     return methods
 
@@ -139,161 +373,60 @@ def map_yaml_type_to_rust(yaml_type: str) -> str:
 
     return type_mapping.get(yaml_type, 'serde_json::Value')
 
+@functools.lru_cache(maxsize=None)
+def classify_params(input_type: Optional[str]) -> str:
+    """Key into PARAMS_FIELDS for a method's input type"""
+    if not input_type:
+        return 'empty'
+    if input_type == 'protocol.AcmeFaucet':
+        return 'faucet'
+    if 'Query' in input_type:
+        return 'query'
+    return 'generic'
+
+@functools.lru_cache(maxsize=None)
+def classify_result(output_type: Optional[str]) -> str:
+    """Key into RESULT_FIELDS for a method's output type"""
+    if not output_type:
+        return 'empty'
+    if '|' in output_type:
+        # Union types are kept as generic JSON
+        return 'generic'
+    if output_type in ('StatusResponse', 'TxResponse'):
+        return output_type
+    return 'generic'
+
 def generate_params_struct(method: ApiMethod) -> str:
     """Generate Rust struct for method parameters"""
-    struct_name = method.get_params_struct_name()
-
-    if not method.input_type:
-        # No input parameters
-        return f"""#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {struct_name} {{
-    // No parameters
-}}"""
-
-    # For now, use a simple generic approach since we don't have detailed field schemas
-    # In a full implementation, you'd parse the input type structure
-    rust_type = map_yaml_type_to_rust(method.input_type)
-
-    if method.input_type == 'protocol.AcmeFaucet':
-        # Special case for faucet - use the transaction body type
-        return f"""#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {struct_name} {{
-    pub url: String,
-}}"""
-    elif 'Query' in method.input_type:
-        # Query types typically have URL and options
-        return f"""#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {struct_name} {{
-    pub url: String,
-    #[serde(skip_serializing_if = "Option::is_none", default)]
-    pub options: Option<serde_json::Value>,
-}}"""
-    else:
-        # Generic structure
-        return f"""#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {struct_name} {{
-    #[serde(flatten)]
-    pub params: serde_json::Value,
-}}"""
+    fields = PARAMS_FIELDS[classify_params(method.input_type)]
+    return STRUCT_TEMPLATE.format(struct_name=method.params_struct, fields=fields)
 
 def generate_result_struct(method: ApiMethod) -> str:
     """Generate Rust struct for method result"""
-    struct_name = method.get_result_struct_name()
-
-    if not method.output_type:
-        # No output
-        return f"""#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {struct_name} {{
-    // No result data
-}}"""
-
-    # Handle union types and specific response types
-    if '|' in method.output_type:
-        return f"""#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {struct_name} {{
-    #[serde(flatten)]
-    pub data: serde_json::Value,
-}}"""
-
-    # Specific response type structures
-    if method.output_type == 'StatusResponse':
-        return f"""#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {struct_name} {{
-    pub ok: bool,
-    #[serde(skip_serializing_if = "Option::is_none", default)]
-    pub last_block_time: Option<String>,
-    #[serde(skip_serializing_if = "Option::is_none", default)]
-    pub version: Option<String>,
-}}"""
-    elif method.output_type == 'TxResponse':
-        return f"""#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {struct_name} {{
-    pub transaction_hash: String,
-    #[serde(skip_serializing_if = "Option::is_none", default)]
-    pub simple_hash: Option<String>,
-    #[serde(skip_serializing_if = "Option::is_none", default)]
-    pub code: Option<u32>,
-    #[serde(skip_serializing_if = "Option::is_none", default)]
-    pub message: Option<String>,
-}}"""
-    else:
-        # Generic response structure
-        return f"""#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {struct_name} {{
-    #[serde(flatten)]
-    pub data: serde_json::Value,
-}}"""
+    fields = RESULT_FIELDS[classify_result(method.output_type)]
+    return STRUCT_TEMPLATE.format(struct_name=method.result_struct, fields=fields)
 
 def generate_client_methods(methods: List[ApiMethod]) -> str:
     """Generate client implementation with all methods"""
     method_impls = []
 
     for method in methods:
-        method_name = method.get_rust_method_name()
-        params_type = method.get_params_struct_name()
-        result_type = method.get_result_struct_name()
-        rpc_name = method.rpc_name
+        method_impls.append(CLIENT_METHOD_TEMPLATE.format(
+            method_name=method.rust_method_name,
+            params_type=method.params_struct,
+            result_type=method.result_struct,
+            rpc_name=method.rpc_name,
+        ))
 
-        method_impl = f"""    pub async fn {method_name}(&self, params: {params_type}) -> Result<{result_type}, Error> {{
-        self.transport.rpc_call("{rpc_name}", &params).await
-    }}"""
-        method_impls.append(method_impl)
-
-    methods_code = '\n\n'.join(method_impls)
-
-    return f"""impl<C: AccumulateRpc + Send + Sync> AccumulateClient<C> {{
-{methods_code}
-}}"""
+    return CLIENT_IMPL_TEMPLATE.format(methods='\n\n'.join(method_impls))
 
 def generate_test_helpers(methods: List[ApiMethod]) -> str:
     """Generate test helper functions for minimal params/results"""
-    helpers = []
-
-    for method in methods:
-        method_name = method.rpc_name
-        params_type = method.get_params_struct_name()
-        result_type = method.get_result_struct_name()
-
-        # Generate minimal params
-        if not method.input_type:
-            params_json = 'json!({})'
-        elif method.input_type == 'protocol.AcmeFaucet':
-            params_json = 'json!({"url": "acc://test.acme"})'
-        elif 'Query' in method.input_type:
-            params_json = 'json!({"url": "acc://test.acme"})'
-        else:
-            params_json = 'json!({})'
+    helpers = [TEST_HELPER_LINE.format(method=method.rpc_name, params=method.params_json_lit,
+                                       result=method.result_json_lit)
+               for method in methods]
 
-        # Generate minimal result
-        if method.output_type == 'StatusResponse':
-            result_json = 'json!({"ok": true})'
-        elif method.output_type == 'TxResponse':
-            result_json = 'json!({"transactionHash": "deadbeef"})'
-        else:
-            result_json = 'json!({"data": {}})'
-
-        helper = f'        "{method_name}" => Some(({params_json}, {result_json})),'
-        helpers.append(helper)
-
-    helpers_code = '\n'.join(helpers)
-
-    return f"""#[cfg(test)]
-pub fn __minimal_pair_for_test(method_name: &str) -> Option<(serde_json::Value, serde_json::Value)> {{
-    use serde_json::json;
-    match method_name {{
-{helpers_code}
-        _ => None,
-    }}
-}}"""
+    return TEST_HELPERS_TEMPLATE.format(helpers='\n'.join(helpers))
 
 def generate_api_methods_rs(methods: List[ApiMethod]) -> str:
     """Generate the complete api_methods.rs file"""
@@ -307,50 +440,13 @@ def generate_api_methods_rs(methods: List[ApiMethod]) -> str:
         param_structs.append(generate_params_struct(method))
         result_structs.append(generate_result_struct(method))
 
-    params_code = '\n\n'.join(param_structs)
-    results_code = '\n\n'.join(result_structs)
-    client_code = generate_client_methods(methods)
-    test_helpers = generate_test_helpers(methods)
-
-    return f"""//! GENERATED FILE - DO NOT EDIT
-//! Source: internal/api/v2/methods.yml
-//! Generated: {timestamp}
-
-use serde::{{Serialize, Deserialize}};
-use crate::errors::Error;
-use crate::generated::header::TransactionHeader;
-use crate::generated::transactions::TransactionBody;
-use async_trait::async_trait;
-
-// AccumulateRpc trait for transport abstraction
-#[async_trait]
-pub trait AccumulateRpc {{
-    async fn rpc_call<TParams: Serialize + Send + Sync, TResult: for<'de> Deserialize<'de>>(
-        &self, method: &str, params: &TParams
-    ) -> Result<TResult, Error>;
-}}
-
-// Generic client wrapper
-pub struct AccumulateClient<C> {{
-    pub transport: C,
-}}
-
-impl<C> AccumulateClient<C> {{
-    pub fn new(transport: C) -> Self {{
-        Self {{ transport }}
-    }}
-}}
-
-// Parameter structures
-{params_code}
-
-// Result structures
-{results_code}
-
-// Client implementation with strongly-typed methods
-{client_code}
-
-{test_helpers}"""
+    return API_METHODS_TEMPLATE.format(
+        timestamp=timestamp,
+        params_code='\n\n'.join(param_structs),
+        results_code='\n\n'.join(result_structs),
+        client_code=generate_client_methods(methods),
+        test_helpers=generate_test_helpers(methods),
+    )
 
 def generate_manifest(methods: List[ApiMethod]) -> Dict[str, Any]:
     """Generate the API manifest JSON"""
@@ -374,9 +470,13 @@ def main():
 
     print("\nLoading YAML files...")
     yaml_data = load_yaml_file(GO_METHODS)
+    if yaml_data is None:
+        return 1
 
     print("\nExtracting API methods...")
     methods = extract_api_methods(yaml_data)
+    if methods is None:
+        return 2
 
     # List methods for verification
     print(f"\nFound {len(methods)} API methods:")
@@ -388,18 +488,20 @@ def main():
 
     # Write api_methods.rs
     api_file = GEN_DIR / "api_methods.rs"
-    with open(api_file, 'w', encoding='utf-8') as f:
-        f.write(api_code)
-    print(f"Generated: {api_file}")
+    if write_if_changed(api_file, api_code):
+        print(f"Generated: {api_file}")
+    else:
+        print(f"Unchanged: {api_file}")
 
     print("\nGenerating manifest...")
     manifest = generate_manifest(methods)
 
     # Write manifest
     manifest_file = GEN_DIR / "api_manifest.json"
-    with open(manifest_file, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2)
-    print(f"Generated: {manifest_file}")
+    if write_if_changed(manifest_file, dumps_json(manifest)):
+        print(f"Generated: {manifest_file}")
+    else:
+        print(f"Unchanged: {manifest_file}")
 
     print(f"\nSuccessfully generated API methods!")
     print(f"   Methods: {len(methods)}")
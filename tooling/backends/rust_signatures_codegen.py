@@ -6,68 +6,252 @@ Generates Rust signature types from Go YAML truth sources.
 Outputs to src/generated/signatures.rs with exact wire compatibility.
 """
 
-import os
+import functools
 import sys
 import yaml
-import json
 from datetime import datetime
 from pathlib import Path
 
+from codegen_common import compute_stamp, dumps_json, is_up_to_date, load_cached
+
+SIGNATURES_YAML = Path("C:/Accumulate_Stuff/accumulate/protocol/signatures.yml")
+OUTPUT_DIR = Path("C:/Accumulate_Stuff/opendlt-rust-v2v3-sdk/unified/src/generated")
+
+# Prefer libyaml's C parser; fall back to the pure-Python loader without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Exact wire tags, based on the YAML union type values and Go SDK conventions;
+# any other signature name is lowercased
+WIRE_MAP = {
+    'LegacyED25519Signature': 'legacyED25519',
+    'RCD1Signature': 'rcd1',
+    'ED25519Signature': 'ed25519',
+    'BTCSignature': 'btc',
+    'BTCLegacySignature': 'btcLegacy',
+    'ETHSignature': 'eth',
+    'RsaSha256Signature': 'rsaSha256',
+    'EcdsaSha256Signature': 'ecdsaSha256',
+    'TypedDataSignature': 'typedData',
+    'ReceiptSignature': 'receipt',
+    'PartitionSignature': 'partition',
+    'SignatureSet': 'signatureSet',
+    'RemoteSignature': 'remote',
+    'DelegatedSignature': 'delegated',
+    'InternalSignature': 'internal',
+    'AuthoritySignature': 'authority',
+}
+
+# YAML scalar and reference types with a fixed Rust spelling; anything else passes through
+TYPE_MAP = {
+    'uint': 'u64',
+    'bytes': 'Vec<u8>',
+    'string': 'String',
+    'hash': '[u8; 32]',
+    'url': 'String',  # URLs as strings for now
+    'bigint': 'String',  # BigInt as string for serde compatibility
+    'VoteType': 'crate::generated::enums::VoteType',
+    'Signature': 'Box<crate::generated::signatures::Signature>',  # Recursive signature reference
+    'merkle.Receipt': 'crate::types::MerkleReceipt',  # Placeholder
+    'txid': 'String',  # Transaction ID as string
+}
+
+NL = '\n'
+
+# Rust source templates (str.format syntax; literal braces are doubled)
+SIGNATURES_HEADER_TEMPLATE = '''// GENERATED FILE - DO NOT EDIT
+// Source: protocol/signatures.yml | Generated: {generated_at}
+
+use serde::{{Serialize, Deserialize}};
+use hex;
+
+// Helper module for optional hex serialization
+mod hex_option {{
+    use serde::{{Deserialize, Deserializer, Serialize, Serializer}};
+
+    pub fn serialize<S>(value: &Option<[u8; 32]>, serializer: S) -> Result<S::Ok, S::Error>
+    where
+        S: Serializer,
+    {{
+        match value {{
+            Some(bytes) => hex::encode(bytes).serialize(serializer),
+            None => serializer.serialize_none(),
+        }}
+    }}
+
+    pub fn deserialize<'de, D>(deserializer: D) -> Result<Option<[u8; 32]>, D::Error>
+    where
+        D: Deserializer<'de>,
+    {{
+        let opt: Option<String> = Option::deserialize(deserializer)?;
+        match opt {{
+            Some(hex_str) => {{
+                let bytes = hex::decode(&hex_str).map_err(serde::de::Error::custom)?;
+                if bytes.len() != 32 {{
+                    return Err(serde::de::Error::custom("Hash must be 32 bytes"));
+                }}
+                let mut hash = [0u8; 32];
+                hash.copy_from_slice(&bytes);
+                Ok(Some(hash))
+            }},
+            None => Ok(None),
+        }}
+    }}
+}}
+
+// Helper module for optional bytes hex serialization
+mod hex_option_vec {{
+    use serde::{{Deserialize, Deserializer, Serialize, Serializer}};
+
+    pub fn serialize<S>(value: &Option<Vec<u8>>, serializer: S) -> Result<S::Ok, S::Error>
+    where
+        S: Serializer,
+    {{
+        match value {{
+            Some(bytes) => hex::encode(bytes).serialize(serializer),
+            None => serializer.serialize_none(),
+        }}
+    }}
+
+    pub fn deserialize<'de, D>(deserializer: D) -> Result<Option<Vec<u8>>, D::Error>
+    where
+        D: Deserializer<'de>,
+    {{
+        let opt: Option<String> = Option::deserialize(deserializer)?;
+        match opt {{
+            Some(hex_str) => {{
+                let bytes = hex::decode(&hex_str).map_err(serde::de::Error::custom)?;
+                Ok(Some(bytes))
+            }},
+            None => Ok(None),
+        }}
+    }}
+}}
+
+// Helper module for vector of hashes hex serialization
+mod hex_vec_hash {{
+    use serde::{{Deserialize, Deserializer, Serialize, Serializer}};
+
+    pub fn serialize<S>(value: &Vec<[u8; 32]>, serializer: S) -> Result<S::Ok, S::Error>
+    where
+        S: Serializer,
+    {{
+        let hex_strings: Vec<String> = value.iter().map(|hash| hex::encode(hash)).collect();
+        hex_strings.serialize(serializer)
+    }}
+
+    pub fn deserialize<'de, D>(deserializer: D) -> Result<Vec<[u8; 32]>, D::Error>
+    where
+        D: Deserializer<'de>,
+    {{
+        let hex_strings: Vec<String> = Vec::deserialize(deserializer)?;
+        let mut result = Vec::new();
+        for hex_str in hex_strings {{
+            let bytes = hex::decode(&hex_str).map_err(serde::de::Error::custom)?;
+            if bytes.len() != 32 {{
+                return Err(serde::de::Error::custom("Hash must be 32 bytes"));
+            }}
+            let mut hash = [0u8; 32];
+            hash.copy_from_slice(&bytes);
+            result.push(hash);
+        }}
+        Ok(result)
+    }}
+}}
+
+// Helper module for vector of bytes hex serialization
+mod hex_vec_bytes {{
+    use serde::{{Deserialize, Deserializer, Serialize, Serializer}};
+
+    pub fn serialize<S>(value: &Vec<Vec<u8>>, serializer: S) -> Result<S::Ok, S::Error>
+    where
+        S: Serializer,
+    {{
+        let hex_strings: Vec<String> = value.iter().map(|bytes| hex::encode(bytes)).collect();
+        hex_strings.serialize(serializer)
+    }}
+
+    pub fn deserialize<'de, D>(deserializer: D) -> Result<Vec<Vec<u8>>, D::Error>
+    where
+        D: Deserializer<'de>,
+    {{
+        let hex_strings: Vec<String> = Vec::deserialize(deserializer)?;
+        let mut result = Vec::new();
+        for hex_str in hex_strings {{
+            let bytes = hex::decode(&hex_str).map_err(serde::de::Error::custom)?;
+            result.push(bytes);
+        }}
+        Ok(result)
+    }}
+}}
+
+/// Error type for signature operations
+#[derive(Debug, thiserror::Error)]
+pub enum SignatureError {{
+    #[error("Invalid signature format")]
+    InvalidFormat,
+    #[error("Verification failed: {{0}}")]
+    VerificationFailed(String),
+    #[error("Unsupported signature type")]
+    UnsupportedType,
+}}
+
+/// Main signature trait for verification
+pub trait AccSignature {{
+    fn verify(&self, message: &[u8]) -> Result<bool, crate::errors::Error>;
+    fn sig_type(&self) -> &'static str;
+}}'''
+
+SIGNATURE_ENUM_TEMPLATE = '''/// Main signature dispatch enum
+#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
+#[serde(tag = "type")]
+pub enum Signature {{
+{variants}
+}}
+
+impl Signature {{
+    pub fn wire_tag(&self) -> &'static str {{
+        match self {{
+{wire_tags}
+        }}
+    }}
+}}'''
+
+ACC_SIGNATURE_IMPL_TEMPLATE = '''impl AccSignature for {name} {{
+    fn verify(&self, message: &[u8]) -> Result<bool, crate::errors::Error> {{
+        {verify_impl}
+    }}
+
+    fn sig_type(&self) -> &'static str {{
+        "{wire_tag}"
+    }}
+}}'''
+
+
+def _parse_yaml(file_path):
+    with open(file_path, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 
 def load_signatures_yaml():
     """Load signature definitions from Go YAML truth source."""
-    yaml_path = Path("C:/Accumulate_Stuff/accumulate/protocol/signatures.yml")
+    yaml_path = SIGNATURES_YAML
     if not yaml_path.exists():
         print(f"ERROR: YAML file not found: {yaml_path}")
         sys.exit(1)
 
-    with open(yaml_path, 'r') as f:
-        data = yaml.safe_load(f)
+    data = load_cached(yaml_path, _parse_yaml)
 
     print(f"Loaded: {yaml_path}")
     return data
 
 
-def get_wire_tag(signature_name):
-    """Map signature names to their exact wire tags."""
-    # Based on the YAML union type values and Go SDK conventions
-    wire_map = {
-        'LegacyED25519Signature': 'legacyED25519',
-        'RCD1Signature': 'rcd1',
-        'ED25519Signature': 'ed25519',
-        'BTCSignature': 'btc',
-        'BTCLegacySignature': 'btcLegacy',
-        'ETHSignature': 'eth',
-        'RsaSha256Signature': 'rsaSha256',
-        'EcdsaSha256Signature': 'ecdsaSha256',
-        'TypedDataSignature': 'typedData',
-        'ReceiptSignature': 'receipt',
-        'PartitionSignature': 'partition',
-        'SignatureSet': 'signatureSet',
-        'RemoteSignature': 'remote',
-        'DelegatedSignature': 'delegated',
-        'InternalSignature': 'internal',
-        'AuthoritySignature': 'authority',
-    }
-    return wire_map.get(signature_name, signature_name.lower())
-
-
+@functools.lru_cache(maxsize=None)
 def rust_type_from_yaml(yaml_type, is_optional=False, is_repeatable=False):
     """Convert YAML type to Rust type."""
-    type_map = {
-        'uint': 'u64',
-        'bytes': 'Vec<u8>',
-        'string': 'String',
-        'hash': '[u8; 32]',
-        'url': 'String',  # URLs as strings for now
-        'bigint': 'String',  # BigInt as string for serde compatibility
-        'VoteType': 'crate::generated::enums::VoteType',
-        'Signature': 'Box<crate::generated::signatures::Signature>',  # Recursive signature reference
-        'merkle.Receipt': 'crate::types::MerkleReceipt',  # Placeholder
-        'txid': 'String',  # Transaction ID as string
-    }
-
-    rust_type = type_map.get(yaml_type, yaml_type)
+    rust_type = TYPE_MAP.get(yaml_type, yaml_type)
 
     if is_repeatable:
         rust_type = f"Vec<{rust_type}>"
@@ -78,6 +262,7 @@ def rust_type_from_yaml(yaml_type, is_optional=False, is_repeatable=False):
     return rust_type
 
 
+@functools.lru_cache(maxsize=None)
 def rust_field_name(yaml_name):
     """Convert YAML field name to Rust snake_case."""
     # Convert PascalCase to snake_case
@@ -99,7 +284,12 @@ def generate_signature_struct(name, fields):
     """Generate a single signature struct."""
     rust_name = name  # Keep original name
 
-    field_definitions = []
+    buf = [
+        f'/// {name} signature\n'
+        '#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]\n'
+        '#[serde(rename_all = "camelCase")]\n'
+        f'pub struct {rust_name} {{\n'
+    ]
     for field in fields:
         field_name = field['name']
         field_type = field['type']
@@ -133,24 +323,20 @@ def generate_signature_struct(name, fields):
                 serde_attrs.append('with = "hex::serde"')
 
         if serde_attrs:
-            field_definitions.append(f'    #[serde({", ".join(serde_attrs)})]')
+            buf.append(f'    #[serde({", ".join(serde_attrs)})]\n')
 
-        field_definitions.append(f'    pub {rust_field}: {rust_type},')
+        buf.append(f'    pub {rust_field}: {rust_type},\n')
 
-    # Generate struct
-    struct_code = f'''/// {name} signature
-#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
-#[serde(rename_all = "camelCase")]
-pub struct {rust_name} {{
-{chr(10).join(field_definitions)}
-}}'''
-
-    return struct_code
+    # A field-less struct keeps its empty body line
+    if not fields:
+        buf.append('\n')
+    buf.append('}')
+    return ''.join(buf)
 
 
 def generate_acc_signature_impl(name):
     """Generate AccSignature implementation for a signature type."""
-    wire_tag = get_wire_tag(name)
+    wire_tag = WIRE_MAP.get(name, name.lower())
 
     # Determine verification strategy based on signature type
     if name == 'ED25519Signature':
@@ -237,15 +423,8 @@ def generate_acc_signature_impl(name):
         // TODO: Stage 1.4 will implement proper verification logic
         Ok(false)"""
 
-    return f'''impl AccSignature for {name} {{
-    fn verify(&self, message: &[u8]) -> Result<bool, crate::errors::Error> {{
-        {verify_impl}
-    }}
-
-    fn sig_type(&self) -> &'static str {{
-        "{wire_tag}"
-    }}
-}}'''
+    return ACC_SIGNATURE_IMPL_TEMPLATE.format(
+        name=name, verify_impl=verify_impl, wire_tag=wire_tag)
 
 
 def generate_signature_enum(signatures_data):
@@ -254,176 +433,22 @@ def generate_signature_enum(signatures_data):
     wire_tags = []
 
     for name in signatures_data:
-        wire_tag = get_wire_tag(name)
+        wire_tag = WIRE_MAP.get(name, name.lower())
         variant_name = name.replace('Signature', '')  # Remove 'Signature' suffix for enum variant
 
         variants.append(f'    #[serde(rename = "{wire_tag}")]')
         variants.append(f'    {variant_name}({name}),')
         wire_tags.append(f'            Signature::{variant_name}(_) => "{wire_tag}",')
 
-    enum_code = f'''/// Main signature dispatch enum
-#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
-#[serde(tag = "type")]
-pub enum Signature {{
-{chr(10).join(variants)}
-}}
-
-impl Signature {{
-    pub fn wire_tag(&self) -> &'static str {{
-        match self {{
-{chr(10).join(wire_tags)}
-        }}
-    }}
-}}'''
-
-    return enum_code
+    return SIGNATURE_ENUM_TEMPLATE.format(
+        variants=NL.join(variants), wire_tags=NL.join(wire_tags))
 
 
 def generate_signatures_rust_file(signatures_data):
     """Generate the complete signatures.rs file."""
     # Header
-    header = f'''// GENERATED FILE - DO NOT EDIT
-// Source: protocol/signatures.yml | Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-use serde::{{Serialize, Deserialize}};
-use hex;
-
-// Helper module for optional hex serialization
-mod hex_option {{
-    use serde::{{Deserialize, Deserializer, Serialize, Serializer}};
-
-    pub fn serialize<S>(value: &Option<[u8; 32]>, serializer: S) -> Result<S::Ok, S::Error>
-    where
-        S: Serializer,
-    {{
-        match value {{
-            Some(bytes) => hex::encode(bytes).serialize(serializer),
-            None => serializer.serialize_none(),
-        }}
-    }}
-
-    pub fn deserialize<'de, D>(deserializer: D) -> Result<Option<[u8; 32]>, D::Error>
-    where
-        D: Deserializer<'de>,
-    {{
-        let opt: Option<String> = Option::deserialize(deserializer)?;
-        match opt {{
-            Some(hex_str) => {{
-                let bytes = hex::decode(&hex_str).map_err(serde::de::Error::custom)?;
-                if bytes.len() != 32 {{
-                    return Err(serde::de::Error::custom("Hash must be 32 bytes"));
-                }}
-                let mut hash = [0u8; 32];
-                hash.copy_from_slice(&bytes);
-                Ok(Some(hash))
-            }},
-            None => Ok(None),
-        }}
-    }}
-}}
-
-// Helper module for optional bytes hex serialization
-mod hex_option_vec {{
-    use serde::{{Deserialize, Deserializer, Serialize, Serializer}};
-
-    pub fn serialize<S>(value: &Option<Vec<u8>>, serializer: S) -> Result<S::Ok, S::Error>
-    where
-        S: Serializer,
-    {{
-        match value {{
-            Some(bytes) => hex::encode(bytes).serialize(serializer),
-            None => serializer.serialize_none(),
-        }}
-    }}
-
-    pub fn deserialize<'de, D>(deserializer: D) -> Result<Option<Vec<u8>>, D::Error>
-    where
-        D: Deserializer<'de>,
-    {{
-        let opt: Option<String> = Option::deserialize(deserializer)?;
-        match opt {{
-            Some(hex_str) => {{
-                let bytes = hex::decode(&hex_str).map_err(serde::de::Error::custom)?;
-                Ok(Some(bytes))
-            }},
-            None => Ok(None),
-        }}
-    }}
-}}
-
-// Helper module for vector of hashes hex serialization
-mod hex_vec_hash {{
-    use serde::{{Deserialize, Deserializer, Serialize, Serializer}};
-
-    pub fn serialize<S>(value: &Vec<[u8; 32]>, serializer: S) -> Result<S::Ok, S::Error>
-    where
-        S: Serializer,
-    {{
-        let hex_strings: Vec<String> = value.iter().map(|hash| hex::encode(hash)).collect();
-        hex_strings.serialize(serializer)
-    }}
-
-    pub fn deserialize<'de, D>(deserializer: D) -> Result<Vec<[u8; 32]>, D::Error>
-    where
-        D: Deserializer<'de>,
-    {{
-        let hex_strings: Vec<String> = Vec::deserialize(deserializer)?;
-        let mut result = Vec::new();
-        for hex_str in hex_strings {{
-            let bytes = hex::decode(&hex_str).map_err(serde::de::Error::custom)?;
-            if bytes.len() != 32 {{
-                return Err(serde::de::Error::custom("Hash must be 32 bytes"));
-            }}
-            let mut hash = [0u8; 32];
-            hash.copy_from_slice(&bytes);
-            result.push(hash);
-        }}
-        Ok(result)
-    }}
-}}
-
-// Helper module for vector of bytes hex serialization
-mod hex_vec_bytes {{
-    use serde::{{Deserialize, Deserializer, Serialize, Serializer}};
-
-    pub fn serialize<S>(value: &Vec<Vec<u8>>, serializer: S) -> Result<S::Ok, S::Error>
-    where
-        S: Serializer,
-    {{
-        let hex_strings: Vec<String> = value.iter().map(|bytes| hex::encode(bytes)).collect();
-        hex_strings.serialize(serializer)
-    }}
-
-    pub fn deserialize<'de, D>(deserializer: D) -> Result<Vec<Vec<u8>>, D::Error>
-    where
-        D: Deserializer<'de>,
-    {{
-        let hex_strings: Vec<String> = Vec::deserialize(deserializer)?;
-        let mut result = Vec::new();
-        for hex_str in hex_strings {{
-            let bytes = hex::decode(&hex_str).map_err(serde::de::Error::custom)?;
-            result.push(bytes);
-        }}
-        Ok(result)
-    }}
-}}
-
-/// Error type for signature operations
-#[derive(Debug, thiserror::Error)]
-pub enum SignatureError {{
-    #[error("Invalid signature format")]
-    InvalidFormat,
-    #[error("Verification failed: {{0}}")]
-    VerificationFailed(String),
-    #[error("Unsupported signature type")]
-    UnsupportedType,
-}}
-
-/// Main signature trait for verification
-pub trait AccSignature {{
-    fn verify(&self, message: &[u8]) -> Result<bool, crate::errors::Error>;
-    fn sig_type(&self) -> &'static str;
-}}'''
+    header = SIGNATURES_HEADER_TEMPLATE.format(
+        generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
 
     # Generate all signature structs
     structs = []
@@ -451,7 +476,7 @@ def generate_manifest(signatures_data):
     signatures = []
 
     for name, data in signatures_data.items():
-        wire_tag = get_wire_tag(name)
+        wire_tag = WIRE_MAP.get(name, name.lower())
         fields = [field['name'] for field in data.get('fields', [])]
 
         signatures.append({
@@ -472,6 +497,18 @@ def generate_manifest(signatures_data):
 def main():
     print("=== Rust Signatures Code Generator ===")
 
+    output_dir = OUTPUT_DIR
+    rust_file = output_dir / "signatures.rs"
+    manifest_file = output_dir / "signatures_manifest.json"
+
+    # Skip everything when neither the YAML nor this generator changed since the last run;
+    # delete the stamp file to force regeneration
+    stamp_file = output_dir / ".signatures_stamp"
+    stamp = compute_stamp(SIGNATURES_YAML, __file__) if SIGNATURES_YAML.exists() else None
+    if stamp and is_up_to_date(stamp_file, stamp, rust_file, manifest_file):
+        print(f"Up-to-date: {rust_file}")
+        return 0
+
     # Load YAML data
     signatures_data = load_signatures_yaml()
 
@@ -486,30 +523,30 @@ def main():
 
     print(f"Found {signature_count} signatures")
     for name in signatures_data:
-        wire_tag = get_wire_tag(name)
+        wire_tag = WIRE_MAP.get(name, name.lower())
         print(f"  {name} -> '{wire_tag}'")
 
     # Generate Rust code
     rust_code = generate_signatures_rust_file(signatures_data)
 
     # Write signatures.rs
-    output_dir = Path("C:/Accumulate_Stuff/opendlt-rust-v2v3-sdk/unified/src/generated")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    rust_file = output_dir / "signatures.rs"
     with open(rust_file, 'w') as f:
         f.write(rust_code)
     print(f"Generated: {rust_file}")
 
     # Generate and write manifest
     manifest = generate_manifest(signatures_data)
-    manifest_file = output_dir / "signatures_manifest.json"
     with open(manifest_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
+        f.write(dumps_json(manifest))
     print(f"Generated: {manifest_file}")
 
+    stamp_file.write_text(stamp)
+
     print(f"SUCCESS: Generated {signature_count} signatures with exact wire compatibility")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -12,20 +12,31 @@ Inputs:
 
 Outputs:
 - tests/conformance/test_protocol_types.rs: Rust conformance tests
-- tests/golden_vectors/types/*.json: JSON golden vectors for each type
+- tests/golden/golden_vectors.json: JSON golden vectors for all types, keyed by type name
 - tests_metadata.json: Test generation metadata
 """
 
+import functools
+import io
 import json
 import sys
 import yaml
-import os
 from pathlib import Path
 from collections import defaultdict, deque
 from typing import Dict, List, Set, Any, Optional, Tuple
 import re
+import shutil
+import subprocess
 from datetime import datetime
 
+from codegen_common import compute_stamp, dumps_json, is_up_to_date, load_cached
+
+# Prefer libyaml's C parser; fall back to the pure-Python loader without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Constants
 GO_REPO = Path(r"C:\Accumulate_Stuff\accumulate")
 GO_ANALYSIS = Path(r"C:\Accumulate_Stuff\accumulate\_analysis_codegen")
@@ -36,10 +47,49 @@ SRC_DIR = RUST_ROOT / "src"
 GEN_DIR = SRC_DIR / "generated"
 TESTS_DIR = RUST_ROOT / "tests"
 CONFORMANCE_DIR = TESTS_DIR / "conformance"
-GOLDEN_TYPES = TESTS_DIR / "golden" / "types"
+GOLDEN_VECTORS_FILE = TESTS_DIR / "golden" / "golden_vectors.json"
 
 AUDIT_DIR = Path(r"C:\Accumulate_Stuff\rust_parity_audit")
 
+# CamelCase word boundaries used by to_snake_case
+SNAKE_WORD_RE = re.compile(r'(.)([A-Z][a-z]+)')
+SNAKE_BOUNDARY_RE = re.compile(r'([a-z0-9])([A-Z])')
+
+# Per-type roundtrip test (str.format syntax; literal braces are doubled)
+CONFORMANCE_TEST_FN_TEMPLATE = """
+    #[test]
+    fn test_{snake_name}_json_roundtrip() {{
+        let golden_data = golden_vectors()
+            .get("{type_name}")
+            .expect("Golden vector not found for {type_name}");
+
+        let test_data = &golden_data["json_data"];
+
+        // Test deserialization from JSON
+        let deserialized: Result<{type_name}, serde_json::Error> =
+            serde_json::from_value(test_data.clone());
+
+        match deserialized {{
+            Ok(obj) => {{
+                // Test serialization back to JSON
+                let serialized = serde_json::to_value(&obj)
+                    .expect("Failed to serialize {type_name} to JSON");
+
+                // Basic structure validation
+                println!("✓ {type_name}: JSON roundtrip successful");
+            }},
+            Err(e) => {{
+                println!("⚠ {type_name}: Deserialization error (expected for incomplete types): {{e}}");
+                // For now, we just log errors since types may be incomplete
+            }}
+        }}
+    }}
+"""
+
+def _parse_json(file_path: Path) -> Any:
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
 class TestGoldenGenerator:
     """Generates comprehensive tests and golden vectors"""
 
@@ -48,6 +98,8 @@ class TestGoldenGenerator:
         self.type_graph: Dict[str, Any] = {}
         self.test_cases: Dict[str, Dict[str, Any]] = {}
         self.golden_vectors: Dict[str, Any] = {}
+        self._sorted_types: List[str] = []
+        self._snake_names: Dict[str, str] = {}
 
     def load_previous_stages(self):
         """Load results from previous stages"""
@@ -58,17 +110,18 @@ class TestGoldenGenerator:
         if not generated_file.exists():
             raise FileNotFoundError(f"Stage 3.2 results not found: {generated_file}")
 
-        with open(generated_file, 'r') as f:
-            generated_data = json.load(f)
-            self.generated_types = generated_data["types_generated"]
+        generated_data = load_cached(generated_file, _parse_json)
+        self.generated_types = generated_data["types_generated"]
+        # Sorted order and snake_case test names per type, derived once
+        self._sorted_types = sorted(self.generated_types)
+        self._snake_names = {t: self.to_snake_case(t) for t in self._sorted_types}
 
         # Load Stage 3.1 results
         graph_file = GEN_DIR / "types_graph.json"
         if not graph_file.exists():
             raise FileNotFoundError(f"Stage 3.1 results not found: {graph_file}")
 
-        with open(graph_file, 'r') as f:
-            self.type_graph = json.load(f)
+        self.type_graph = load_cached(graph_file, _parse_json)
 
         print(f"Loaded {len(self.generated_types)} generated types")
         print(f"Loaded type graph with {len(self.type_graph['nodes'])} nodes")
@@ -163,25 +216,27 @@ class TestGoldenGenerator:
         """Generate golden vectors for all types"""
         print("=== Generating Golden Vectors ===")
 
-        # Ensure golden vectors directory exists
-        GOLDEN_TYPES.mkdir(parents=True, exist_ok=True)
+        for type_name in self._sorted_types:
+            self.golden_vectors[type_name] = self.create_golden_vector(type_name)
 
-        for type_name in sorted(self.generated_types):
-            print(f"Creating golden vector for {type_name}...")
-
-            golden_vector = self.create_golden_vector(type_name)
-            self.golden_vectors[type_name] = golden_vector
-
-            # Write individual golden vector file
-            golden_file = GOLDEN_TYPES / f"{type_name.lower()}.json"
-            with open(golden_file, 'w', encoding='utf-8') as f:
-                json.dump(golden_vector, f, indent=2)
+        # One file keyed by type name rather than a file per type
+        GOLDEN_VECTORS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(GOLDEN_VECTORS_FILE, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(dumps_json(self.golden_vectors))
+            f.write('\n')
 
         print(f"Generated {len(self.golden_vectors)} golden vectors")
 
     def generate_conformance_test(self) -> str:
         """Generate Rust conformance test code"""
-        test_code = f"""//! Protocol Type Conformance Tests
+        out = io.StringIO()
+        self._emit_conformance_test(out)
+        return out.getvalue()
+
+    def _emit_conformance_test(self, out):
+        """Write Rust conformance test code to an open text stream"""
+        write = out.write
+        write(f"""//! Protocol Type Conformance Tests
 //!
 //! Auto-generated comprehensive tests for all protocol types.
 //! Generated at: {datetime.now().isoformat()}
@@ -190,91 +245,69 @@ class TestGoldenGenerator:
 //! To modify tests, edit the test generator and re-run.
 
 use serde_json;
+use std::collections::HashMap;
 use std::fs;
-use std::path::Path;
+use std::sync::OnceLock;
 
 use crate::generated::types::*;
 
+/// Golden vectors for every protocol type, keyed by type name and parsed once per test run
+fn golden_vectors() -> &'static HashMap<String, serde_json::Value> {{
+    static VECTORS: OnceLock<HashMap<String, serde_json::Value>> = OnceLock::new();
+    VECTORS.get_or_init(|| {{
+        let content = fs::read_to_string("tests/golden/golden_vectors.json")
+            .expect("Failed to read golden vectors");
+        serde_json::from_str(&content)
+            .expect("Failed to parse golden vectors JSON")
+    }})
+}}
+
 /// Test JSON serialization/deserialization for all protocol types
 #[cfg(test)]
 mod protocol_conformance_tests {{
     use super::*;
 
-"""
+""")
 
         # Generate individual test for each type
-        for type_name in sorted(self.generated_types):
-            snake_name = self.to_snake_case(type_name)
-            test_code += f"""
-    #[test]
-    fn test_{snake_name}_json_roundtrip() {{
-        let golden_path = Path::new("tests/golden/types/{type_name.lower()}.json");
-        assert!(golden_path.exists(), "Golden vector not found for {type_name}");
+        for type_name in self._sorted_types:
+            write(CONFORMANCE_TEST_FN_TEMPLATE.format(
+                snake_name=self._snake_names[type_name], type_name=type_name))
 
-        let golden_content = fs::read_to_string(golden_path)
-            .expect("Failed to read golden vector");
-        let golden_data: serde_json::Value = serde_json::from_str(&golden_content)
-            .expect("Failed to parse golden vector JSON");
-
-        let test_data = &golden_data["json_data"];
-
-        // Test deserialization from JSON
-        let deserialized: Result<{type_name}, serde_json::Error> =
-            serde_json::from_value(test_data.clone());
-
-        match deserialized {{
-            Ok(obj) => {{
-                // Test serialization back to JSON
-                let serialized = serde_json::to_value(&obj)
-                    .expect("Failed to serialize {type_name} to JSON");
-
-                // Basic structure validation
-                println!("✓ {type_name}: JSON roundtrip successful");
-            }},
-            Err(e) => {{
-                println!("⚠ {type_name}: Deserialization error (expected for incomplete types): {{e}}");
-                // For now, we just log errors since types may be incomplete
-            }}
-        }}
-    }}
-"""
-
-        test_code += """
+        write("""
 }
 
 /// Integration test for all protocol types
 #[test]
 fn test_all_protocol_types_coverage() {
-    let golden_dir = Path::new("tests/golden/types");
-    assert!(golden_dir.exists(), "Golden vectors directory not found");
+    let vectors = golden_vectors();
 
     let expected_types = vec![
-"""
+""")
 
         # Add all type names to the coverage test
-        for type_name in sorted(self.generated_types):
-            test_code += f'        "{type_name}",\n'
+        for type_name in self._sorted_types:
+            write(f'        "{type_name}",\n')
 
-        test_code += f"""    ];
+        write(f"""    ];
 
     assert_eq!(expected_types.len(), {len(self.generated_types)},
                "Expected exactly {len(self.generated_types)} protocol types");
 
     for type_name in expected_types {{
-        let golden_file = golden_dir.join(format!("{{type_name}}.json").to_lowercase());
-        assert!(golden_file.exists(), "Golden vector missing for {{type_name}}");
+        assert!(vectors.contains_key(type_name), "Golden vector missing for {{type_name}}");
     }}
 
     println!("✓ All {len(self.generated_types)} protocol types have golden vectors");
 }}
-"""
+""")
 
-        return test_code
-
-    def to_snake_case(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def to_snake_case(name: str) -> str:
         """Convert CamelCase to snake_case"""
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        s1 = SNAKE_WORD_RE.sub(r'\1_\2', name)
+        return SNAKE_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
 
     def write_conformance_tests(self):
         """Write the conformance test file"""
@@ -283,11 +316,15 @@ fn test_all_protocol_types_coverage() {
         # Ensure conformance directory exists
         CONFORMANCE_DIR.mkdir(parents=True, exist_ok=True)
 
-        test_content = self.generate_conformance_test()
         test_file = CONFORMANCE_DIR / "test_protocol_types.rs"
 
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write(test_content)
+        # Stream straight to disk rather than building the whole source in memory
+        with open(test_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self._emit_conformance_test(f)
+
+        # Leave the file as `cargo fmt` would, so fmt-check passes on the checked-in copy
+        if shutil.which("rustfmt"):
+            subprocess.run(["rustfmt", "--edition", "2021", str(test_file)], check=False)
 
         print(f"Generated conformance tests: {test_file}")
 
@@ -301,13 +338,13 @@ fn test_all_protocol_types_coverage() {
             "target_count": len(self.generated_types),
             "golden_vectors_created": len(self.golden_vectors),
             "conformance_tests_created": True,
-            "types_tested": sorted(self.generated_types),
+            "types_tested": self._sorted_types,
             "validation_passed": len(self.golden_vectors) == len(self.generated_types)
         }
 
         metadata_file = TESTS_DIR / "tests_metadata.json"
         with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+            f.write(dumps_json(metadata))
 
         print(f"Exported test metadata: {metadata_file}")
 
@@ -325,6 +362,16 @@ def main():
     print("=" * 60)
 
     try:
+        # Skip everything when the stage inputs and this generator are unchanged since the
+        # last successful run; delete the stamp file to force regeneration
+        inputs = [GEN_DIR / "types_generated.json", GEN_DIR / "types_graph.json", Path(__file__)]
+        stamp_file = TESTS_DIR / ".tests_golden_stamp"
+        stamp = compute_stamp(*inputs) if all(p.exists() for p in inputs) else None
+        outputs = [GOLDEN_VECTORS_FILE, CONFORMANCE_DIR / "test_protocol_types.rs", TESTS_DIR / "tests_metadata.json"]
+        if stamp and is_up_to_date(stamp_file, stamp, *outputs):
+            print("\\nSTAGE 3.3 UP-TO-DATE: Inputs unchanged since last generation")
+            sys.exit(0)
+
         generator = TestGoldenGenerator()
         generator.load_previous_stages()
         generator.generate_all_golden_vectors()
@@ -335,6 +382,7 @@ def main():
             print("\\nSTAGE 3.3 FAILED: Test generation validation failed")
             sys.exit(2)
         else:
+            stamp_file.write_text(stamp)
             print("\\nSTAGE 3.3 COMPLETED: Tests and golden vectors generated successfully")
             sys.exit(0)
 